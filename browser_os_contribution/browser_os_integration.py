@@ -17,96 +17,66 @@ Integration Points:
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Callable
+import re
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from collections import OrderedDict
 import subprocess
 import sys
 import os
+import time
 
 from local_gpt_agent import LocalGPTAgent, FormField, FormFieldType
-from linkedin_workflow_automation import LinkedInWorkflowAutomation, JobPosting
+from linkedin_workflow_automation import LinkedInWorkflowAutomation, JobPosting, wait_for_change
 
 
-class BrowserOSAPI:
-	"""Interface to BrowserOS native APIs"""
-	
-	def __init__(self):
-		self.extension_path = Path("./browser_extension")
-		self.native_host_path = Path("./native_host")
-		self.is_connected = False
-		self.message_handlers: Dict[str, Callable] = {}
-	
-	async def initialize(self) -> bool:
-		"""Initialize connection to BrowserOS"""
-		try:
-			# Check if BrowserOS is running
-			if not self._is_browseros_running():
-				logging.error("BrowserOS is not running. Please start BrowserOS first.")
-				return False
-			
-			# Setup native messaging host
-			await self._setup_native_messaging()
-			
-			# Install browser extension if needed
-			await self._install_extension()
-			
-			self.is_connected = True
-			logging.info("Successfully connected to BrowserOS")
-			return True
-			
-		except Exception as e:
-			logging.error(f"Failed to initialize BrowserOS connection: {e}")
-			return False
-	
-	def _is_browseros_running(self) -> bool:
-		"""Check if BrowserOS process is running"""
-		try:
-			# Check for BrowserOS process
-			import psutil
-			for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-				if 'browseros' in proc.info['name'].lower():
-					return True
-			return False
-		except ImportError:
-			logging.warning("psutil not available, cannot check BrowserOS status")
-			return True  # Assume it's running
-	
-	async def _setup_native_messaging(self):
-		"""Setup native messaging host for browser communication"""
-		self.native_host_path.mkdir(exist_ok=True)
-		
-		# Create native messaging host manifest
-		manifest = {
-			"name": "com.local_gpt_agent.native_host",
-			"description": "Local GPT Agent Native Host",
-			"path": str(self.native_host_path / "native_host.py"),
-			"type": "stdio",
-			"allowed_origins": [
-				"chrome-extension://your-extension-id/"
-			]
-		}
-		
-		manifest_path = self.native_host_path / "manifest.json"
-		with open(manifest_path, 'w') as f:
-			json.dump(manifest, f, indent=2)
-		
-		# Create native host script
-		native_host_script = '''#!/usr/bin/env python3
+# Static browser extension and native host assets, pre-encoded so they are
+# written verbatim on every initialize without going through a text codec
+_NATIVE_HOST_SCRIPT = b'''#!/usr/bin/env python3
 """
 Native messaging host for Local GPT Agent
 Handles communication between browser extension and Python agent
 """
 
+import os
 import sys
 import json
 import struct
+import socket
 import asyncio
 import logging
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    def _loads(data):
+        return json.loads(str(data, 'utf-8'))
+    
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Native messaging frames are a native-endian uint32 length followed by the payload
+_HDR = struct.Struct('@I')
+
+# Socket the agent listens on for messages relayed from the extension
+_RELAY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'agent.sock')
+
 class NativeHost:
     def __init__(self):
+        self._rbuf = bytearray()
+        # Message type -> handler; each handler takes the full message
+        self._dispatch = {
+            'ping': self.ping,
+            'detect_forms': self.detect_forms,
+            'fill_form': self.fill_form,
+            'voice_command': self.handle_voice_command,
+            'page_changed': self.page_changed
+        }
         self.setup_logging()
     
     def setup_logging(self):
@@ -118,35 +88,78 @@ class NativeHost:
     
     def read_message(self):
         """Read message from browser extension"""
-        raw_length = sys.stdin.buffer.read(4)
-        if len(raw_length) == 0:
+        if not self._fill_buffer(_HDR.size):
+            return None
+        
+        frame_end = _HDR.size + _HDR.unpack_from(self._rbuf)[0]
+        if not self._fill_buffer(frame_end):
             return None
         
-        message_length = struct.unpack('@I', raw_length)[0]
-        message = sys.stdin.buffer.read(message_length).decode('utf-8')
-        return json.loads(message)
+        payload = memoryview(self._rbuf)[_HDR.size:frame_end]
+        try:
+            return _loads(payload)
+        finally:
+            payload.release()
+            del self._rbuf[:frame_end]
+    
+    def _fill_buffer(self, size):
+        """Read from stdin until at least size bytes are buffered"""
+        # read1 returns whatever is already available, so queued frames are
+        # drained with a single syscall and parsed from the buffer
+        while len(self._rbuf) < size:
+            chunk = sys.stdin.buffer.read1(65536)
+            if not chunk:
+                return False
+            self._rbuf += chunk
+        return True
     
     def send_message(self, message):
         """Send message to browser extension"""
-        encoded_message = json.dumps(message).encode('utf-8')
-        sys.stdout.buffer.write(struct.pack('@I', len(encoded_message)))
-        sys.stdout.buffer.write(encoded_message)
+        encoded_message = _dumps(message)
+        # Write header and payload as a single frame
+        sys.stdout.buffer.write(_HDR.pack(len(encoded_message)) + encoded_message)
         sys.stdout.buffer.flush()
     
     def run(self):
         """Main message handling loop"""
         logging.info("Native host started")
+        asyncio.run(self._main())
+    
+    async def _main(self):
+        """Read and handle messages concurrently so slow handlers don't stall reads"""
+        queue = asyncio.Queue(maxsize=64)
+        await asyncio.gather(self._reader(queue), self._worker(queue))
+    
+    async def _reader(self, queue):
+        """Read messages from stdin off the event loop and queue them"""
+        loop = asyncio.get_running_loop()
         
         while True:
             try:
-                message = self.read_message()
-                if message is None:
-                    break
-                
+                message = await loop.run_in_executor(None, self.read_message)
+            except Exception as e:
+                # A failed read leaves the stream position unknown, so treat it as end of input
+                logging.error(f"Error reading message: {e}")
+                message = None
+            
+            await queue.put(message)
+            if message is None:
+                break
+    
+    async def _worker(self, queue):
+        """Handle queued messages in order and write their responses"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            message = await queue.get()
+            if message is None:
+                break
+            
+            try:
                 logging.info(f"Received message: {message}")
                 
                 # Handle different message types
-                response = self.handle_message(message)
+                response = await loop.run_in_executor(None, self.handle_message, message)
                 self.send_message(response)
                 
             except Exception as e:
@@ -156,19 +169,32 @@ class NativeHost:
     def handle_message(self, message):
         """Handle incoming messages from extension"""
         msg_type = message.get('type', '')
-        
-        if msg_type == 'ping':
-            return {"type": "pong", "timestamp": message.get('timestamp')}
-        elif msg_type == 'detect_forms':
-            return self.detect_forms(message.get('data', {}))
-        elif msg_type == 'fill_form':
-            return self.fill_form(message.get('data', {}))
-        elif msg_type == 'voice_command':
-            return self.handle_voice_command(message.get('data', {}))
-        else:
+        handler = self._dispatch.get(msg_type)
+        if handler is None:
             return {"error": f"Unknown message type: {msg_type}"}
+        return handler(message)
+    
+    def ping(self, message):
+        """Answer a liveness check"""
+        return {"type": "pong", "timestamp": message.get('timestamp')}
+    
+    def page_changed(self, message):
+        """Relay a navigation or tab switch reported by the extension to the agent"""
+        url = message.get('data', {}).get('url')
+        logging.info(f"Page changed: {url}")
+        self.relay_to_agent(message)
+        return {"type": "page_changed", "url": url}
+    
+    def relay_to_agent(self, message):
+        """Forward a message to the running agent; dropped if the agent isn't listening"""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(_RELAY_PATH)
+                sock.sendall(_dumps(message) + b'\\n')
+        except OSError as e:
+            logging.info(f"Agent relay unavailable: {e}")
     
-    def detect_forms(self, data):
+    def detect_forms(self, message):
         """Detect forms on the page"""
         # This would integrate with the LocalGPTAgent
         return {
@@ -184,17 +210,18 @@ class NativeHost:
             ]
         }
     
-    def fill_form(self, data):
+    def fill_form(self, message):
         """Fill form with AI suggestions"""
+        data = message.get('data', {})
         return {
             "type": "form_filled",
             "success": True,
             "filled_fields": data.get('fields', [])
         }
     
-    def handle_voice_command(self, data):
+    def handle_voice_command(self, message):
         """Handle voice commands"""
-        command = data.get('command', '')
+        command = message.get('data', {}).get('command', '')
         return {
             "type": "voice_command_processed",
             "command": command,
@@ -205,68 +232,19 @@ if __name__ == "__main__":
     host = NativeHost()
     host.run()
 '''
-		
-		host_script_path = self.native_host_path / "native_host.py"
-		with open(host_script_path, 'w') as f:
-			f.write(native_host_script)
-		
-		# Make script executable
-		os.chmod(host_script_path, 0o755)
-	
-	async def _install_extension(self):
-		"""Install browser extension in BrowserOS"""
-		self.extension_path.mkdir(exist_ok=True)
-		
-		# Create extension manifest
-		manifest = {
-			"manifest_version": 3,
-			"name": "Local GPT Agent",
-			"version": "1.0.0",
-			"description": "Privacy-first AI assistant for form filling and automation",
-			"permissions": [
-				"activeTab",
-				"storage",
-				"nativeMessaging",
-				"scripting"
-			],
-			"host_permissions": [
-				"https://linkedin.com/*",
-				"https://*.linkedin.com/*"
-			],
-			"background": {
-				"service_worker": "background.js"
-			},
-			"content_scripts": [
-				{
-					"matches": ["<all_urls>"],
-					"js": ["content.js"],
-					"run_at": "document_end"
-				}
-			],
-			"action": {
-				"default_popup": "popup.html",
-				"default_title": "Local GPT Agent"
-			},
-			"native_messaging_hosts": {
-				"com.local_gpt_agent.native_host": {
-					"description": "Local GPT Agent Native Host"
-				}
-			}
-		}
-		
-		with open(self.extension_path / "manifest.json", 'w') as f:
-			json.dump(manifest, f, indent=2)
-		
-		# Create background script
-		background_js = '''
+
+_BACKGROUND_JS = b'''
 // Background script for Local GPT Agent
 // Handles communication with native host and coordinates between content scripts
 
 class LocalGPTBackground {
     constructor() {
         this.nativePort = null;
+        // Tab id -> pending injection, so overlapping toggles share one injection
+        this.injecting = new Map();
         this.setupNativeMessaging();
         this.setupMessageHandlers();
+        this.setupNavigationListeners();
     }
     
     setupNativeMessaging() {
@@ -300,18 +278,90 @@ class LocalGPTBackground {
         chrome.action.onClicked.addListener((tab) => {
             this.handleIconClick(tab);
         });
+        
+        // Handle the toggle shortcut without a persistent content script
+        chrome.commands.onCommand.addListener((command, tab) => {
+            if (command === 'toggle-agent' && tab) {
+                this.toggleAgent(tab.id);
+            }
+        });
+    }
+    
+    setupNavigationListeners() {
+        // Tell the agent when the active page changes so it can re-check it at once;
+        // onUpdated also reports in-page pushState navigation, which LinkedIn uses
+        chrome.tabs.onUpdated.addListener((tabId, changeInfo, tab) => {
+            if (changeInfo.url && tab.active) {
+                this.notifyPageChanged(changeInfo.url);
+            }
+        });
+        
+        chrome.tabs.onActivated.addListener(({tabId}) => {
+            chrome.tabs.get(tabId, (tab) => {
+                this.notifyPageChanged(tab && tab.url);
+            });
+        });
+    }
+    
+    notifyPageChanged(url) {
+        if (this.nativePort) {
+            this.nativePort.postMessage({
+                type: 'page_changed',
+                data: {url: url || null}
+            });
+        }
+    }
+    
+    ensureContentScript(tabId) {
+        // A second toggle arriving between the probe and the injection would
+        // otherwise inject the scripts twice
+        if (!this.injecting.has(tabId)) {
+            const pending = this.injectContentScript(tabId).finally(() => {
+                this.injecting.delete(tabId);
+            });
+            this.injecting.set(tabId, pending);
+        }
+        return this.injecting.get(tabId);
+    }
+    
+    async injectContentScript(tabId) {
+        // Content scripts are injected on demand rather than into every page
+        const [probe] = await chrome.scripting.executeScript({
+            target: {tabId: tabId},
+            func: () => Boolean(globalThis.localGPTContent)
+        });
+        
+        if (!probe || !probe.result) {
+            await chrome.scripting.executeScript({
+                target: {tabId: tabId},
+                files: ['forms.js', 'content.js']
+            });
+        }
+    }
+    
+    async toggleAgent(tabId) {
+        try {
+            await this.ensureContentScript(tabId);
+            chrome.tabs.sendMessage(tabId, {
+                type: 'toggle_agent',
+                data: {}
+            });
+        } catch (error) {
+            console.error('Failed to toggle agent:', error);
+        }
     }
     
     handleNativeMessage(message) {
         console.log('Message from native host:', message);
         
-        // Forward message to appropriate content script
+        // Forward message to the active tab's content script, if the agent was
+        // activated there; pages that never used it are left untouched
         chrome.tabs.query({active: true, currentWindow: true}, (tabs) => {
             if (tabs[0]) {
                 chrome.tabs.sendMessage(tabs[0].id, {
                     type: 'native_message',
                     data: message
-                });
+                }).catch(() => {});
             }
         });
     }
@@ -327,6 +377,9 @@ class LocalGPTBackground {
                     data: request.data
                 });
             }
+        } else if (request.type === 'toggle_agent') {
+            // Sent by the popup, which passes the tab to toggle
+            this.toggleAgent(request.data.tabId);
         } else if (request.type === 'voice_command') {
             // Forward voice command to native host
             if (this.nativePort) {
@@ -342,50 +395,38 @@ class LocalGPTBackground {
     
     handleIconClick(tab) {
         // Inject content script or show popup
-        chrome.tabs.sendMessage(tab.id, {
-            type: 'toggle_agent',
-            data: {}
-        });
+        this.toggleAgent(tab.id);
     }
 }
 
 new LocalGPTBackground();
 '''
-		
-		with open(self.extension_path / "background.js", 'w') as f:
-			f.write(background_js)
-		
-		# Create content script
-		content_js = '''
+
+_CONTENT_JS = b'''
 // Content script for Local GPT Agent
-// Monitors DOM for forms and handles user interactions
+// Injected on activation; monitors DOM for forms and handles user interactions
 
 class LocalGPTContent {
     constructor() {
         this.isActive = false;
         this.detectedForms = [];
+        this.detectTimer = null;
+        this.notificationEl = null;
+        this.notificationTimer = null;
         this.setupEventListeners();
         this.setupMessageHandlers();
-        this.startFormDetection();
     }
     
     setupEventListeners() {
-        // Listen for keyboard shortcuts
-        document.addEventListener('keydown', (event) => {
-            if (event.ctrlKey && event.shiftKey && event.key === 'G') {
-                this.toggleAgent();
-            }
-        });
-        
         // Listen for DOM changes
         this.observer = new MutationObserver((mutations) => {
             this.handleDOMChanges(mutations);
         });
         
+        // Only structural changes can add forms, so attribute churn is ignored
         this.observer.observe(document.body, {
             childList: true,
-            subtree: true,
-            attributes: true
+            subtree: true
         });
     }
     
@@ -423,47 +464,8 @@ class LocalGPTContent {
         }
     }
     
-    startFormDetection() {
-        // Automatically detect forms on page load
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', () => {
-                this.detectForms();
-            });
-        } else {
-            this.detectForms();
-        }
-    }
-    
     detectForms() {
-        const forms = document.querySelectorAll('form');
-        const formData = [];
-        
-        forms.forEach((form, index) => {
-            const fields = [];
-            const inputs = form.querySelectorAll('input, select, textarea');
-            
-            inputs.forEach((input) => {
-                if (input.type !== 'hidden' && input.type !== 'submit') {
-                    fields.push({
-                        id: input.id || input.name || `field_${index}`,
-                        type: input.type || 'text',
-                        label: this.getFieldLabel(input),
-                        placeholder: input.placeholder || '',
-                        required: input.required,
-                        value: input.value
-                    });
-                }
-            });
-            
-            if (fields.length > 0) {
-                formData.push({
-                    id: form.id || `form_${index}`,
-                    action: form.action || window.location.href,
-                    method: form.method || 'POST',
-                    fields: fields
-                });
-            }
-        });
+        const formData = globalThis.localGPTScanForms();
         
         this.detectedForms = formData;
         
@@ -479,45 +481,29 @@ class LocalGPTContent {
         }
     }
     
-    getFieldLabel(input) {
-        // Try to find associated label
-        if (input.id) {
-            const label = document.querySelector(`label[for="${input.id}"]`);
-            if (label) return label.textContent.trim();
-        }
-        
-        // Check for parent label
-        const parentLabel = input.closest('label');
-        if (parentLabel) return parentLabel.textContent.trim();
-        
-        // Check for nearby text
-        const previousElement = input.previousElementSibling;
-        if (previousElement && previousElement.textContent) {
-            return previousElement.textContent.trim();
+    handleDOMChanges(mutations) {
+        // Re-detect forms when DOM changes add a form
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE &&
+                    (node.tagName === 'FORM' || node.querySelector('form'))) {
+                    this.scheduleDetection();
+                    return;
+                }
+            }
         }
-        
-        return input.name || input.placeholder || 'Unknown field';
     }
     
-    handleDOMChanges(mutations) {
-        // Re-detect forms when DOM changes
-        let shouldRedetect = false;
-        
-        mutations.forEach((mutation) => {
-            if (mutation.type === 'childList') {
-                mutation.addedNodes.forEach((node) => {
-                    if (node.nodeType === Node.ELEMENT_NODE) {
-                        if (node.tagName === 'FORM' || node.querySelector('form')) {
-                            shouldRedetect = true;
-                        }
-                    }
-                });
-            }
-        });
-        
-        if (shouldRedetect) {
-            setTimeout(() => this.detectForms(), 500);
+    scheduleDetection() {
+        // Trailing throttle: a burst of mutations collapses into one scan 300 ms after
+        // the first, and a page that keeps adding forms is still scanned every 300 ms
+        if (this.detectTimer !== null) {
+            return;
         }
+        this.detectTimer = setTimeout(() => {
+            this.detectTimer = null;
+            this.detectForms();
+        }, 300);
     }
     
     handleNativeMessage(message) {
@@ -543,7 +529,28 @@ class LocalGPTContent {
     }
     
     showNotification(message) {
-        // Create and show notification
+        // The notification element is created and styled once, then reused
+        if (!this.notificationEl) {
+            this.notificationEl = this.createNotification();
+        }
+        
+        // Restart the hide timer so rapid notifications don't stack timers
+        if (this.notificationTimer !== null) {
+            clearTimeout(this.notificationTimer);
+        }
+        
+        this.notificationEl.textContent = message;
+        if (!this.notificationEl.isConnected) {
+            document.body.appendChild(this.notificationEl);
+        }
+        
+        this.notificationTimer = setTimeout(() => {
+            this.notificationTimer = null;
+            this.notificationEl.remove();
+        }, 3000);
+    }
+    
+    createNotification() {
         const notification = document.createElement('div');
         notification.style.cssText = `
             position: fixed;
@@ -558,25 +565,83 @@ class LocalGPTContent {
             font-size: 14px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         `;
-        notification.textContent = message;
-        
-        document.body.appendChild(notification);
-        
-        setTimeout(() => {
-            notification.remove();
-        }, 3000);
+        return notification;
     }
 }
 
-// Initialize content script
-new LocalGPTContent();
+// Initialize content script; the background script injects it on demand and
+// checks this global first so a tab never gets a second instance
+globalThis.localGPTContent = new LocalGPTContent();
 '''
-		
-		with open(self.extension_path / "content.js", 'w') as f:
-			f.write(content_js)
-		
-		# Create popup HTML
-		popup_html = '''
+
+_FORMS_JS = b'''
+// Form scanner for Local GPT Agent
+// Injected on demand by the popup and background script; also used by content.js
+// once the agent is active on a page
+
+globalThis.localGPTScanForms = () => {
+    // document.forms and form.elements are native collections, so no selector matching is needed
+    const forms = document.forms;
+    const formData = [];
+    
+    for (let index = 0, formCount = forms.length; index < formCount; index++) {
+        const form = forms[index];
+        const fields = [];
+        const inputs = form.elements;
+    
+        for (let i = 0, n = inputs.length; i < n; i++) {
+            const input = inputs[i];
+            const tag = input.tagName;
+            if (tag !== 'INPUT' && tag !== 'SELECT' && tag !== 'TEXTAREA') continue;
+    
+            const type = input.type;
+            if (type === 'hidden' || type === 'submit') continue;
+    
+            fields.push({
+                id: input.id || input.name || `field_${index}`,
+                type: type || 'text',
+                label: getFieldLabel(input),
+                placeholder: input.placeholder || '',
+                required: input.required,
+                value: input.value
+            });
+        }
+    
+        if (fields.length > 0) {
+            formData.push({
+                id: form.id || `form_${index}`,
+                action: form.action || window.location.href,
+                method: form.method || 'POST',
+                fields: fields
+            });
+        }
+    }
+    
+    return formData;
+};
+
+function getFieldLabel(input) {
+    // Try to find associated label
+    if (input.id) {
+        const label = document.querySelector(`label[for="${input.id}"]`);
+        if (label) return label.textContent.trim();
+    }
+    
+    // Check for parent label
+    const parentLabel = input.closest('label');
+    if (parentLabel) return parentLabel.textContent.trim();
+    
+    // Check for nearby text
+    const previousElement = input.previousElementSibling;
+    if (previousElement && previousElement.textContent) {
+        return previousElement.textContent.trim();
+    }
+    
+    return input.name || input.placeholder || 'Unknown field';
+}
+'''
+
+_POPUP_HTML = b'''
 <!DOCTYPE html>
 <html>
 <head>
@@ -654,12 +719,8 @@ new LocalGPTContent();
 </body>
 </html>
 '''
-		
-		with open(self.extension_path / "popup.html", 'w') as f:
-			f.write(popup_html)
-		
-		# Create popup JavaScript
-		popup_js = '''
+
+_POPUP_JS = b'''
 // Popup script for Local GPT Agent
 
 class LocalGPTPopup {
@@ -689,9 +750,10 @@ class LocalGPTPopup {
     async toggleAgent() {
         const [tab] = await chrome.tabs.query({active: true, currentWindow: true});
         
-        chrome.tabs.sendMessage(tab.id, {
+        // The background script injects the content script before toggling
+        chrome.runtime.sendMessage({
             type: 'toggle_agent',
-            data: {}
+            data: {tabId: tab.id}
         });
         
         setTimeout(() => this.updateStatus(), 500);
@@ -700,10 +762,28 @@ class LocalGPTPopup {
     async detectForms() {
         const [tab] = await chrome.tabs.query({active: true, currentWindow: true});
         
-        chrome.tabs.sendMessage(tab.id, {
-            type: 'detect_forms',
-            data: {}
+        // Scan the page once on demand instead of keeping a content script on every tab
+        await chrome.scripting.executeScript({
+            target: {tabId: tab.id},
+            files: ['forms.js']
         });
+        const [scan] = await chrome.scripting.executeScript({
+            target: {tabId: tab.id},
+            func: () => globalThis.localGPTScanForms()
+        });
+        
+        const forms = (scan && scan.result) || [];
+        document.getElementById('formsCount').textContent = forms.length;
+        
+        if (forms.length > 0) {
+            chrome.runtime.sendMessage({
+                type: 'form_detected',
+                data: {
+                    url: tab.url,
+                    forms: forms
+                }
+            });
+        }
     }
     
     activateVoice() {
@@ -745,9 +825,226 @@ class LocalGPTPopup {
 
 new LocalGPTPopup();
 '''
+
+# Browser input types mapped to field types; unknown types are treated as text
+_FIELD_TYPES: Dict[str, FormFieldType] = {t.value: t for t in FormFieldType}
+
+# Browser extension manifest, serialized once since it never changes
+_EXTENSION_MANIFEST = json.dumps({
+	"manifest_version": 3,
+	"name": "Local GPT Agent",
+	"version": "1.0.0",
+	"description": "Privacy-first AI assistant for form filling and automation",
+	"permissions": [
+		"activeTab",
+		"storage",
+		"nativeMessaging",
+		"scripting",
+		"tabs"
+	],
+	"host_permissions": [
+		"https://linkedin.com/*",
+		"https://*.linkedin.com/*"
+	],
+	"background": {
+		"service_worker": "background.js"
+	},
+	"commands": {
+		"toggle-agent": {
+			"suggested_key": {
+				"default": "Ctrl+Shift+G"
+			},
+			"description": "Toggle Local GPT Agent"
+		}
+	},
+	"action": {
+		"default_popup": "popup.html",
+		"default_title": "Local GPT Agent"
+	},
+	"native_messaging_hosts": {
+		"com.local_gpt_agent.native_host": {
+			"description": "Local GPT Agent Native Host"
+		}
+	}
+}, indent=2).encode('utf-8')
+
+
+@lru_cache(maxsize=8)
+def _native_host_manifest(host_script_path: str) -> bytes:
+	"""Serialized native messaging host manifest for a host script path"""
+	manifest = {
+		"name": "com.local_gpt_agent.native_host",
+		"description": "Local GPT Agent Native Host",
+		"path": host_script_path,
+		"type": "stdio",
+		"allowed_origins": [
+			"chrome-extension://your-extension-id/"
+		]
+	}
+	return json.dumps(manifest, indent=2).encode('utf-8')
+
+# Voice phrases for browser control and the message each one sends; matched
+# with a single compiled alternation instead of one substring scan per phrase
+_BROWSER_COMMANDS: Dict[str, Tuple[str, Dict[str, str]]] = {
+	"scroll down": ("scroll", {"direction": "down"}),
+	"scroll up": ("scroll", {"direction": "up"}),
+	"go back": ("navigate", {"action": "back"}),
+	"refresh page": ("navigate", {"action": "refresh"})
+}
+_BROWSER_COMMAND_RE = re.compile("(" + "|".join(map(re.escape, _BROWSER_COMMANDS)) + ")")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+	"""Write data to path unless the file already holds identical bytes"""
+	try:
+		if path.stat().st_size == len(data) and path.read_bytes() == data:
+			return False
+	except FileNotFoundError:
+		pass
+	
+	# Write through a raw descriptor; the payloads are already encoded, so the
+	# buffered file object layer would only add an extra copy
+	fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+	try:
+		view = memoryview(data)
+		while view:
+			view = view[os.write(fd, view):]
+	finally:
+		os.close(fd)
+	return True
+
+
+async def _write_all_if_changed(files: List[Tuple[Path, bytes]]):
+	"""Write independent files concurrently on the default executor"""
+	loop = asyncio.get_running_loop()
+	await asyncio.gather(*(
+		loop.run_in_executor(None, _write_if_changed, path, data)
+		for path, data in files
+	))
+
+
+class BrowserOSAPI:
+	"""Interface to BrowserOS native APIs"""
+	
+	# Seconds to reuse the result of a BrowserOS process scan
+	PROCESS_CHECK_TTL = 2.0
+	
+	def __init__(self):
+		self.extension_path = Path("./browser_extension")
+		self.native_host_path = Path("./native_host")
+		self.is_connected = False
+		self.message_handlers: Dict[str, Callable] = {}
+		self._browseros_last_check = 0.0
+		self._browseros_last_result: Optional[bool] = None
+		self.page_changed = asyncio.Event()
+		self._page_change_listeners: List[Callable[[], None]] = []
+		self._loop: Optional[asyncio.AbstractEventLoop] = None
+		self._relay_server: Optional[asyncio.AbstractServer] = None
+		self.message_handlers["page_changed"] = lambda data: self.notify_page_changed()
+	
+	async def initialize(self) -> bool:
+		"""Initialize connection to BrowserOS"""
+		try:
+			self._loop = asyncio.get_running_loop()
+			
+			# Check if BrowserOS is running
+			if not self._is_browseros_running():
+				logging.error("BrowserOS is not running. Please start BrowserOS first.")
+				return False
+			
+			# Setup native messaging host
+			await self._setup_native_messaging()
+			await self._start_relay_server()
+			
+			# Install browser extension if needed
+			await self._install_extension()
+			
+			self.is_connected = True
+			logging.info("Successfully connected to BrowserOS")
+			return True
+			
+		except Exception as e:
+			logging.error(f"Failed to initialize BrowserOS connection: {e}")
+			return False
+	
+	def _is_browseros_running(self) -> bool:
+		"""Check if BrowserOS process is running"""
+		now = time.monotonic()
+		if self._browseros_last_result is not None and now - self._browseros_last_check < self.PROCESS_CHECK_TTL:
+			return self._browseros_last_result
 		
-		with open(self.extension_path / "popup.js", 'w') as f:
-			f.write(popup_js)
+		self._browseros_last_result = self._scan_for_browseros()
+		self._browseros_last_check = now
+		return self._browseros_last_result
+	
+	def _scan_for_browseros(self) -> bool:
+		"""Scan the process table for a BrowserOS process"""
+		try:
+			# Only the name is needed; collecting cmdline costs an extra read per process
+			import psutil
+			for proc in psutil.process_iter(['name']):
+				if 'browseros' in (proc.info['name'] or '').lower():
+					return True
+			return False
+		except ImportError:
+			logging.warning("psutil not available, cannot check BrowserOS status")
+			return True  # Assume it's running
+	
+	async def _setup_native_messaging(self):
+		"""Setup native messaging host for browser communication"""
+		self.native_host_path.mkdir(exist_ok=True)
+		
+		# Create native messaging host manifest and script
+		host_script_path = self.native_host_path / "native_host.py"
+		await _write_all_if_changed([
+			(self.native_host_path / "manifest.json", _native_host_manifest(str(host_script_path))),
+			(host_script_path, _NATIVE_HOST_SCRIPT)
+		])
+		
+		# Make script executable
+		os.chmod(host_script_path, 0o755)
+	
+	async def _start_relay_server(self):
+		"""Listen for messages the native host relays from the extension"""
+		if not hasattr(asyncio, "start_unix_server"):
+			logging.warning("Unix sockets not available, page change relay disabled")
+			return
+		
+		socket_path = self.native_host_path / "agent.sock"
+		socket_path.unlink(missing_ok=True)
+		self._relay_server = await asyncio.start_unix_server(self._handle_relay_connection, path=str(socket_path))
+	
+	async def _handle_relay_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+		"""Dispatch each newline-delimited JSON message from a relay connection"""
+		try:
+			async for line in reader:
+				try:
+					self.handle_message(json.loads(line))
+				except ValueError as e:
+					logging.warning(f"Ignoring malformed relay message: {e}")
+		finally:
+			writer.close()
+	
+	async def close(self):
+		"""Stop accepting relayed messages"""
+		if self._relay_server is not None:
+			self._relay_server.close()
+			await self._relay_server.wait_closed()
+			self._relay_server = None
+	
+	async def _install_extension(self):
+		"""Install browser extension in BrowserOS"""
+		self.extension_path.mkdir(exist_ok=True)
+		
+		# Create extension manifest, scripts and popup
+		await _write_all_if_changed([
+			(self.extension_path / "manifest.json", _EXTENSION_MANIFEST),
+			(self.extension_path / "background.js", _BACKGROUND_JS),
+			(self.extension_path / "content.js", _CONTENT_JS),
+			(self.extension_path / "forms.js", _FORMS_JS),
+			(self.extension_path / "popup.html", _POPUP_HTML),
+			(self.extension_path / "popup.js", _POPUP_JS)
+		])
 	
 	async def send_message(self, message_type: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 		"""Send message to browser extension"""
@@ -758,13 +1055,35 @@ new LocalGPTPopup();
 		message = {
 			"type": message_type,
 			"data": data,
-			"timestamp": asyncio.get_event_loop().time()
+			"timestamp": time.monotonic()
 		}
 		
 		# In real implementation, this would use the native messaging protocol
 		logging.info(f"Sending message to BrowserOS: {message}")
 		return {"success": True}
 	
+	def handle_message(self, message: Dict[str, Any]):
+		"""Dispatch a message relayed from the browser extension to its handler"""
+		handler = self.message_handlers.get(message.get("type", ""))
+		if handler is not None:
+			handler(message.get("data", {}))
+	
+	def register_page_change_listener(self, listener: Callable[[], None]):
+		"""Register a callback run whenever the active page URL changes"""
+		self._page_change_listeners.append(listener)
+	
+	def notify_page_changed(self):
+		"""Signal a navigation or tab switch; safe to call from any thread"""
+		if self._loop is None:
+			return
+		self._loop.call_soon_threadsafe(self.page_changed.set)
+		for listener in self._page_change_listeners:
+			self._loop.call_soon_threadsafe(listener)
+	
+	async def wait_for_page_change(self):
+		"""Wait for a page change, falling back to a periodic heartbeat check"""
+		await wait_for_change(self.page_changed)
+	
 	async def get_current_page_info(self) -> Dict[str, Any]:
 		"""Get information about the current page"""
 		response = await self.send_message("get_page_info", {})
@@ -775,21 +1094,21 @@ new LocalGPTPopup();
 		response = await self.send_message("detect_forms", {})
 		if response and response.get("forms"):
 			# Convert browser form data to FormField objects
-			forms = []
-			for form_data in response["forms"]:
-				for field_data in form_data.get("fields", []):
-					forms.append(FormField(
-						id=field_data["id"],
-						element_id=field_data["id"],
-						field_type=FormFieldType(field_data.get("type", "text")),
-						label=field_data.get("label", ""),
-						placeholder=field_data.get("placeholder", ""),
-						required=field_data.get("required", False),
-						current_value=field_data.get("value", ""),
-						xpath=f"//input[@id='{field_data['id']}']",
-						confidence=0.9
-					))
-			return forms
+			return [
+				FormField(
+					id=field_data["id"],
+					element_id=field_data["id"],
+					field_type=_FIELD_TYPES.get(field_data.get("type"), FormFieldType.TEXT),
+					label=field_data.get("label", ""),
+					placeholder=field_data.get("placeholder", ""),
+					required=field_data.get("required", False),
+					current_value=field_data.get("value", ""),
+					xpath=f"//input[@id='{field_data['id']}']",
+					confidence=0.9
+				)
+				for form_data in response["forms"]
+				for field_data in form_data.get("fields", ())
+			]
 		return []
 	
 	async def fill_form_field(self, field_id: str, value: str) -> bool:
@@ -804,11 +1123,30 @@ new LocalGPTPopup();
 class BrowserOSIntegration:
 	"""Main integration class that coordinates all components"""
 	
+	# Maximum number of cached field suggestion lists
+	SUGGESTION_CACHE_SIZE = 512
+	
 	def __init__(self):
 		self.browser_api = BrowserOSAPI()
 		self.gpt_agent: Optional[LocalGPTAgent] = None
 		self.linkedin_automation: Optional[LinkedInWorkflowAutomation] = None
 		self.is_initialized = False
+		
+		# Field suggestions keyed by page URL and field signature, in LRU order
+		self._suggestion_cache: "OrderedDict[Tuple[str, str, str, str], List[str]]" = OrderedDict()
+		
+		# Reused by get_integration_status, which the popup polls
+		self._status: Dict[str, Any] = {
+			"initialized": False,
+			"browser_api_connected": False,
+			"gpt_agent_active": False,
+			"linkedin_automation_active": False,
+			"components": {
+				"browser_api": False,
+				"gpt_agent": False,
+				"linkedin_automation": False
+			}
+		}
 	
 	async def initialize(self, config: Optional[Dict[str, Any]] = None) -> bool:
 		"""Initialize the complete integration"""
@@ -865,19 +1203,21 @@ class BrowserOSIntegration:
 			"""Handle voice commands that need browser interaction"""
 			command = parameters.get("command", "").lower()
 			
-			if "scroll down" in command:
-				await self.browser_api.send_message("scroll", {"direction": "down"})
-			elif "scroll up" in command:
-				await self.browser_api.send_message("scroll", {"direction": "up"})
-			elif "go back" in command:
-				await self.browser_api.send_message("navigate", {"action": "back"})
-			elif "refresh page" in command:
-				await self.browser_api.send_message("navigate", {"action": "refresh"})
+			match = _BROWSER_COMMAND_RE.search(command)
+			if match:
+				message_type, data = _BROWSER_COMMANDS[match.group(1)]
+				await self.browser_api.send_message(message_type, data)
 		
 		if self.gpt_agent:
 			self.gpt_agent.voice_processor.register_intent_callback(
 				"browser_control", handle_browser_voice_commands
 			)
+		
+		# Wake LinkedIn automation on navigation instead of polling
+		if self.linkedin_automation:
+			self.browser_api.register_page_change_listener(
+				self.linkedin_automation.notify_url_changed
+			)
 	
 	async def start_linkedin_automation(self):
 		"""Start LinkedIn automation with browser integration"""
@@ -909,10 +1249,9 @@ class BrowserOSIntegration:
 			# Get AI suggestions for forms
 			suggestions = {}
 			if forms and self.gpt_agent:
+				page_url = page_info.get("url", "")
 				for form in forms:
-					form_suggestions = await self.gpt_agent.rag_pipeline.get_field_suggestions(
-						form, self.gpt_agent.ollama_client
-					)
+					form_suggestions = await self._get_field_suggestions(form, page_url)
 					if form_suggestions:
 						suggestions[form.element_id] = form_suggestions[0]
 			
@@ -934,20 +1273,16 @@ class BrowserOSIntegration:
 			return {"error": "Integration not initialized"}
 		
 		try:
+			page_info = await self.browser_api.get_current_page_info()
+			page_url = page_info.get("url", "")
 			forms = await self.browser_api.detect_forms()
-			filled_count = 0
 			
-			for form in forms:
-				suggestions = await self.gpt_agent.rag_pipeline.get_field_suggestions(
-					form, self.gpt_agent.ollama_client
-				)
-				
-				if suggestions and suggestions[0]:
-					success = await self.browser_api.fill_form_field(
-						form.element_id, suggestions[0]
-					)
-					if success:
-						filled_count += 1
+			# Fill fields concurrently so native messaging round-trips overlap
+			results = await asyncio.gather(
+				*(self._fill_one(form, page_url) for form in forms),
+				return_exceptions=True
+			)
+			filled_count = sum(1 for result in results if result is True)
 			
 			return {
 				"success": True,
@@ -959,19 +1294,54 @@ class BrowserOSIntegration:
 			logging.error(f"Error auto-filling forms: {e}")
 			return {"error": str(e)}
 	
+	async def _fill_one(self, form: FormField, page_url: str) -> bool:
+		"""Fill a single field with its top AI suggestion"""
+		try:
+			suggestions = await self._get_field_suggestions(form, page_url)
+			
+			if suggestions and suggestions[0]:
+				return bool(await self.browser_api.fill_form_field(
+					form.element_id, suggestions[0]
+				))
+			return False
+			
+		except Exception as e:
+			logging.error(f"Error filling field {form.element_id}: {e}")
+			return False
+	
+	async def _get_field_suggestions(self, form: FormField, page_url: str) -> List[str]:
+		"""Get AI suggestions for a field, reusing results for fields seen on the same page"""
+		key = (page_url, form.label, form.placeholder, form.field_type.value)
+		cached = self._suggestion_cache.get(key)
+		if cached is not None:
+			self._suggestion_cache.move_to_end(key)
+			return cached
+		
+		suggestions = await self.gpt_agent.rag_pipeline.get_field_suggestions(
+			form, self.gpt_agent.ollama_client
+		)
+		
+		if suggestions:
+			self._suggestion_cache[key] = suggestions
+			if len(self._suggestion_cache) > self.SUGGESTION_CACHE_SIZE:
+				self._suggestion_cache.popitem(last=False)
+		return suggestions
+	
 	async def get_integration_status(self) -> Dict[str, Any]:
 		"""Get status of all integration components"""
-		return {
-			"initialized": self.is_initialized,
-			"browser_api_connected": self.browser_api.is_connected,
-			"gpt_agent_active": self.gpt_agent.is_active if self.gpt_agent else False,
-			"linkedin_automation_active": self.linkedin_automation.is_active if self.linkedin_automation else False,
-			"components": {
-				"browser_api": bool(self.browser_api),
-				"gpt_agent": bool(self.gpt_agent),
-				"linkedin_automation": bool(self.linkedin_automation)
-			}
-		}
+		# Refresh the status template in place; callers get copies so they can't alter it
+		status = self._status
+		status["initialized"] = self.is_initialized
+		status["browser_api_connected"] = self.browser_api.is_connected
+		status["gpt_agent_active"] = self.gpt_agent.is_active if self.gpt_agent else False
+		status["linkedin_automation_active"] = self.linkedin_automation.is_active if self.linkedin_automation else False
+		
+		components = status["components"]
+		components["browser_api"] = bool(self.browser_api)
+		components["gpt_agent"] = bool(self.gpt_agent)
+		components["linkedin_automation"] = bool(self.linkedin_automation)
+		
+		return {**status, "components": components.copy()}
 	
 	async def shutdown(self):
 		"""Shutdown all components gracefully"""
@@ -983,6 +1353,9 @@ class BrowserOSIntegration:
 		if self.gpt_agent:
 			await self.gpt_agent.stop()
 		
+		if self.browser_api:
+			await self.browser_api.close()
+		
 		self.is_initialized = False
 		logging.info("BrowserOS integration shutdown complete")
 
@@ -1029,7 +1402,7 @@ async def main():
 				if status.get("automation_ready"):
 					logging.info("Automation opportunity detected")
 				
-				await asyncio.sleep(5)  # Check every 5 seconds
+				await integration.browser_api.wait_for_page_change()
 				
 		else:
 			logging.error("Failed to initialize BrowserOS integration")
@@ -19,15 +19,33 @@ Architecture:
 import asyncio
 import json
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Callable
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Callable
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict
 from uuid_extensions import uuid7str
 import hashlib
-from local_gpt_agent import LocalGPTAgent, FormField, FormFieldType, RAGPipeline
+import os
+import re
+from local_gpt_agent import (
+	MAIN_MODEL, OLLAMA_KEEP_ALIVE, OLLAMA_OPTIONS, LocalGPTAgent, FormField, FormFieldType, RAGPipeline
+)
+
+try:
+	import xxhash
+except ImportError:
+	xxhash = None
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Seconds to wait for a page or URL change before re-checking anyway; change
+# notifications only cut this short, so it keeps the original polling cadence
+HEARTBEAT_INTERVAL = 5.0
 
 
 class ApplicationStatus(str, Enum):
@@ -52,7 +70,7 @@ class WorkflowStepType(str, Enum):
 	SCREENING_QUESTION = "screening_question"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
 	"""Individual step in a workflow"""
 	id: str = field(default_factory=uuid7str)
@@ -68,10 +86,11 @@ class WorkflowStep:
 	conditions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPosting:
 	"""LinkedIn job posting information"""
-	id: str = field(default_factory=uuid7str)
+	# Assigned when the posting is first persisted; most detected postings never are
+	id: str = ""
 	job_id: str = ""
 	title: str = ""
 	company: str = ""
@@ -87,7 +106,7 @@ class JobPosting:
 	application_deadline: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationRecord:
 	"""Record of a job application"""
 	id: str = field(default_factory=uuid7str)
@@ -102,7 +121,7 @@ class ApplicationRecord:
 	follow_up_dates: List[datetime] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTemplate:
 	"""Reusable workflow for similar job applications"""
 	id: str = field(default_factory=uuid7str)
@@ -111,16 +130,180 @@ class WorkflowTemplate:
 	company_pattern: str = ""
 	job_type_pattern: str = ""
 	steps: List[WorkflowStep] = field(default_factory=list)
-	success_rate: float = 0.0
+	successes: int = 0
+	failures: int = 0
 	usage_count: int = 0
 	created_date: datetime = field(default_factory=datetime.now)
 	last_updated: datetime = field(default_factory=datetime.now)
 	tags: List[str] = field(default_factory=list)
+	
+	@property
+	def success_rate(self) -> float:
+		"""Fraction of replays that succeeded"""
+		runs = self.successes + self.failures
+		return self.successes / runs if runs else 0.0
+
+
+def _fast_hash(text: str) -> str:
+	"""Non-cryptographic hex digest used for dedupe and cache keys"""
+	if xxhash is not None:
+		return xxhash.xxh3_64_hexdigest(text)
+	return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+class _LRUCache(OrderedDict):
+	"""Dict bounded to maxsize entries, evicting the least recently used"""
+	
+	def __init__(self, maxsize: int):
+		super().__init__()
+		self.maxsize = maxsize
+	
+	def __getitem__(self, key):
+		value = super().__getitem__(key)
+		self.move_to_end(key)
+		return value
+	
+	def get(self, key, default=None):
+		return self[key] if key in self else default
+	
+	def __setitem__(self, key, value):
+		super().__setitem__(key, value)
+		self.move_to_end(key)
+		if len(self) > self.maxsize:
+			self.popitem(last=False)
+
+
+def _job_key(job: JobPosting) -> str:
+	"""Key identifying a job across applications, by company and title"""
+	return _fast_hash(f"{job.company}_{job.title}")
+
+
+@dataclass(slots=True)
+class ApplicationSummary:
+	"""The fields of an application the tracker's running aggregates need"""
+	applied_date: datetime
+	status: ApplicationStatus
+	job_key: Optional[str] = None
+	
+	@classmethod
+	def from_record(cls, app: "ApplicationRecord") -> "ApplicationSummary":
+		job_key = _job_key(app.job_posting) if isinstance(app.job_posting, JobPosting) else None
+		return cls(app.applied_date, app.status, job_key)
+	
+	@classmethod
+	def from_json(cls, app_data: Dict[str, Any]) -> "ApplicationSummary":
+		job_data = app_data.get('job_posting')
+		job_key = _fast_hash(f"{job_data['company']}_{job_data['title']}") if job_data else None
+		return cls(_parse_datetime(app_data['applied_date']), ApplicationStatus(app_data['status']), job_key)
+
+
+def _json_default(obj: Any) -> Any:
+	"""Serialize datetimes for the stdlib json fallback"""
+	if isinstance(obj, datetime):
+		return obj.isoformat()
+	raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+	"""Parse an ISO timestamp written by the journal"""
+	return datetime.fromisoformat(value) if value else None
+
+
+async def wait_for_change(event: asyncio.Event, timeout: float = HEARTBEAT_INTERVAL):
+	"""Wait for event to be set, falling back to a periodic heartbeat, then reset it"""
+	try:
+		await asyncio.wait_for(event.wait(), timeout)
+	except asyncio.TimeoutError:
+		pass
+	event.clear()
+
+
+class JsonlJournal:
+	"""Append-only JSONL storage where the last line written for a record id wins"""
+	
+	def __init__(self, path: Path, snapshot: Callable[[], Iterable[Any]], compact_after: int = 200, flush_delay: float = 5.0):
+		self.path = path
+		self.snapshot = snapshot
+		self.compact_after = compact_after
+		self.flush_delay = flush_delay
+		self._stale_lines = 0
+		
+		# Changed records awaiting the next flush, latest version per id
+		self._pending: Dict[str, Any] = {}
+		self._flush_task: Optional[asyncio.Task] = None
+	
+	def load(self) -> Dict[str, Dict[str, Any]]:
+		"""Replay the journal into the latest version of each record"""
+		records: Dict[str, Dict[str, Any]] = {}
+		line_count = 0
+		if self.path.exists():
+			loads = orjson.loads if orjson is not None else json.loads
+			with open(self.path, 'rb') as f:
+				for line in f:
+					if line.strip():
+						record = loads(line)
+						records[record["id"]] = record
+						line_count += 1
+		
+		self._stale_lines = line_count - len(records)
+		return records
+	
+	def append(self, record: Any):
+		"""Mark a record changed; it is written by the next flush"""
+		self._pending[record.id] = record
+		
+		if self._flush_task is not None and not self._flush_task.done():
+			return
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			# No event loop to flush later on, so write through
+			self.flush()
+			return
+		self._flush_task = loop.create_task(self._flush_later())
+	
+	async def _flush_later(self):
+		"""Batch changes made within flush_delay into a single write"""
+		await asyncio.sleep(self.flush_delay)
+		self.flush()
+	
+	def flush(self):
+		"""Write pending records, compacting the journal once enough lines are stale"""
+		if not self._pending:
+			return
+		
+		records, self._pending = list(self._pending.values()), {}
+		with open(self.path, 'ab') as f:
+			f.writelines(self._encode(record) for record in records)
+		
+		self._stale_lines += len(records)
+		if self._stale_lines >= self.compact_after:
+			self.rewrite()
+	
+	def rewrite(self):
+		"""Compact the journal down to one line per record"""
+		self._pending.clear()
+		tmp_path = self.path.with_suffix(".tmp")
+		with open(tmp_path, 'wb') as f:
+			f.writelines(self._encode(record) for record in self.snapshot())
+		os.replace(tmp_path, self.path)
+		self._stale_lines = 0
+	
+	@staticmethod
+	def _encode(record: Any) -> bytes:
+		if orjson is not None:
+			return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+		if not isinstance(record, dict):
+			record = asdict(record)
+		return (json.dumps(record, default=_json_default) + "\n").encode()
 
 
 class LinkedInDetector:
 	"""Detects LinkedIn pages and Easy Apply opportunities"""
 	
+	# Maximum number of detected jobs kept in memory
+	DETECTED_JOBS_CACHE_SIZE = 1024
+	
 	def __init__(self):
 		self.linkedin_patterns = {
 			"job_page": r"linkedin\.com/jobs/view/(\d+)",
@@ -131,24 +314,33 @@ class LinkedInDetector:
 			"job_description": ".description__text"
 		}
 		
-		self.detected_jobs: Dict[str, JobPosting] = {}
+		self.detected_jobs: Dict[str, JobPosting] = _LRUCache(self.DETECTED_JOBS_CACHE_SIZE)
+		self._job_page_re = re.compile(self.linkedin_patterns["job_page"])
 	
 	async def is_linkedin_job_page(self, url: str) -> bool:
 		"""Check if current page is a LinkedIn job posting"""
-		import re
-		return bool(re.search(self.linkedin_patterns["job_page"], url))
+		return self._job_page_re.search(url) is not None
 	
 	async def detect_easy_apply_opportunity(self) -> List[JobPosting]:
 		"""Detect Easy Apply opportunities on current page"""
 		# In real implementation, this would use browser APIs
 		# For demonstration, we simulate detection
 		
+		job_id = "3456789012"
+		url = f"https://linkedin.com/jobs/view/{job_id}"
+		
+		# Check the hash first so re-detecting the same posting allocates nothing
+		job_hash = self._generate_job_hash(url, job_id)
+		cached = self.detected_jobs.get(job_hash)
+		if cached is not None:
+			return [cached]
+		
 		sample_job = JobPosting(
-			job_id="3456789012",
+			job_id=job_id,
 			title="Senior Software Engineer",
 			company="Tech Innovators Inc.",
 			location="San Francisco, CA",
-			url="https://linkedin.com/jobs/view/3456789012",
+			url=url,
 			description="We are looking for a senior software engineer...",
 			requirements=["Python", "JavaScript", "React", "Node.js"],
 			salary_range="$120k - $180k",
@@ -157,16 +349,14 @@ class LinkedInDetector:
 			easy_apply_available=True
 		)
 		
-		job_hash = self._generate_job_hash(sample_job)
 		self.detected_jobs[job_hash] = sample_job
 		
-		logging.info(f"Detected Easy Apply opportunity: {sample_job.title} at {sample_job.company}")
+		logging.info("Detected Easy Apply opportunity: %s at %s", sample_job.title, sample_job.company)
 		return [sample_job]
 	
-	def _generate_job_hash(self, job: JobPosting) -> str:
-		"""Generate unique hash for job posting"""
-		hash_string = f"{job.company}_{job.title}_{job.location}_{job.job_id}"
-		return hashlib.md5(hash_string.encode()).hexdigest()
+	def _generate_job_hash(self, url: str, job_id: str) -> str:
+		"""Generate unique hash for a job posting from its URL and LinkedIn id"""
+		return _fast_hash(f"{url}_{job_id}")
 	
 	async def extract_job_details(self, job_url: str) -> JobPosting:
 		"""Extract detailed job information from LinkedIn page"""
@@ -185,14 +375,43 @@ class LinkedInDetector:
 		)
 
 
+# Screening question categories in priority order with their trigger keywords
+_KEYWORD_GROUPS = (
+	("years_experience", frozenset({"years", "experience", "long"})),
+	("salary_expectation", frozenset({"salary", "compensation", "pay"})),
+	("availability", frozenset({"start", "available", "when"})),
+	("work_authorization", frozenset({"authorized", "eligible", "visa"})),
+	("relocation", frozenset({"relocate", "move", "location"})),
+	("remote_work", frozenset({"remote", "work from home"})),
+)
+
+# One alternation over every keyword; each category is a named group
+_QUESTION_TYPE_RE = re.compile("|".join(
+	f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+	for category, keywords in _KEYWORD_GROUPS
+))
+
+
+# Returned when the LLM gives no usable answer for a screening question
+_FALLBACK_SCREENING_RESPONSE = "I would be happy to discuss this further in an interview."
+
+
 class ScreeningHandler:
 	"""Handles LinkedIn screening questions intelligently"""
 	
+	# Maximum number of cached responses and classifications
+	RESPONSE_CACHE_SIZE = 2048
+	
+	# Questions per LLM prompt; longer screens are split into concurrent batches
+	SCREENING_BATCH_SIZE = 5
+	
 	def __init__(self, rag_pipeline: RAGPipeline, ollama_client):
 		self.rag_pipeline = rag_pipeline
 		self.ollama_client = ollama_client
 		self.common_questions = self._load_common_questions()
-		self.response_cache: Dict[str, str] = {}
+		self.response_cache: Dict[str, str] = _LRUCache(self.RESPONSE_CACHE_SIZE)
+		self._classification_cache: Dict[str, str] = _LRUCache(self.RESPONSE_CACHE_SIZE)
+		self._user_ctx_cached: Optional[Tuple[Tuple[int, int], str, str]] = None
 	
 	def _load_common_questions(self) -> Dict[str, str]:
 		"""Load common screening questions and suggested responses"""
@@ -211,18 +430,47 @@ class ScreeningHandler:
 	
 	async def handle_screening_question(self, question: str, job_context: JobPosting) -> str:
 		"""Generate intelligent response to screening question"""
+		return (await self.handle_screening_questions([question], job_context))[0]
+	
+	async def handle_screening_questions(self, questions: List[str], job_context: JobPosting, max_inflight: int = 4) -> List[str]:
+		"""Answer all screening questions for a job with as few concurrent LLM calls as possible"""
 		
 		# Check cache first
-		question_hash = hashlib.md5(question.encode()).hexdigest()
-		if question_hash in self.response_cache:
-			return self.response_cache[question_hash]
+		question_hashes = [_fast_hash(question) for question in questions]
+		answers = {h: self.response_cache.get(h) for h in question_hashes}
+		pending = [(h, q) for h, q in zip(question_hashes, questions) if answers[h] is None]
+		
+		if pending:
+			# Dedupe repeated questions so each is asked once
+			pending = list(dict(pending).items())
+			batches = [
+				pending[i:i + self.SCREENING_BATCH_SIZE]
+				for i in range(0, len(pending), self.SCREENING_BATCH_SIZE)
+			]
+			semaphore = asyncio.Semaphore(max_inflight)
+			
+			async def answer_batch(batch: List[Tuple[str, str]]) -> Dict[str, str]:
+				async with semaphore:
+					return await self._generate_batch_responses(batch, job_context)
+			
+			for batch_answers in await asyncio.gather(*map(answer_batch, batches)):
+				answers.update(batch_answers)
+		
+		return [answers[h] or _FALLBACK_SCREENING_RESPONSE for h in question_hashes]
+	
+	async def _generate_batch_responses(self, pending: List[Tuple[str, str]], job_context: JobPosting) -> Dict[str, str]:
+		"""Ask the LLM for every pending (hash, question) pair in one prompt"""
 		
 		# Use RAG pipeline for context-aware response
 		user_context = self.rag_pipeline.user_context
+		experience, skills = self._serialized_user_context()
+		numbered_questions = "\n\t\t".join(
+			f'{i}. "{question}"' for i, (_, question) in enumerate(pending, 1)
+		)
 		
 		prompt = f"""
 		You are helping with a LinkedIn job application. Based on the user's context and the job details,
-		provide an appropriate, honest, and professional response to this screening question.
+		provide an appropriate, honest, and professional response to each screening question.
 		
 		Job Context:
 		- Title: {job_context.title}
@@ -231,91 +479,161 @@ class ScreeningHandler:
 		- Location: {job_context.location}
 		
 		User Context:
-		- Experience: {json.dumps(user_context.work_experience, indent=2)}
-		- Skills: {', '.join(user_context.skills)}
+		- Experience: {experience}
+		- Skills: {skills}
 		- Location: {user_context.address}
 		
-		Screening Question: "{question}"
+		Screening Questions:
+		{numbered_questions}
 		
-		Provide a concise, professional response that is truthful and aligns with the user's background.
+		Provide concise, professional responses that are truthful and align with the user's background.
 		If specific numbers or dates are needed, base them on the user's actual experience.
-		Keep the response under 100 words and professional in tone.
+		Keep each response under 100 words and professional in tone.
 		
-		Response:
+		Respond with only a JSON object mapping each question number to its response,
+		for example {{"1": "...", "2": "..."}}.
 		"""
 		
 		try:
-			response = self.ollama_client.generate(
-				model='llama3.2',
-				prompt=prompt
+			# Same model settings as the agent, so Ollama keeps one resident copy
+			response = await self.ollama_client.generate(
+				model=MAIN_MODEL,
+				prompt=prompt,
+				format='json',
+				keep_alive=OLLAMA_KEEP_ALIVE,
+				options=OLLAMA_OPTIONS
 			)
 			
-			answer = response['response'].strip()
-			
-			# Cache the response
-			self.response_cache[question_hash] = answer
-			
-			return answer
+			loads = orjson.loads if orjson is not None else json.loads
+			parsed = loads(response['response'])
+			if not isinstance(parsed, dict):
+				raise ValueError("expected a JSON object of responses")
 			
 		except Exception as e:
-			logging.error(f"Error generating screening response: {e}")
-			return "I would be happy to discuss this further in an interview."
+			logging.error(f"Error generating screening responses: {e}")
+			return {}
+		
+		answers = {}
+		for i, (question_hash, _) in enumerate(pending, 1):
+			answer = parsed.get(str(i))
+			if isinstance(answer, str) and answer.strip():
+				answers[question_hash] = answer.strip()
+				
+				# Cache the response
+				self.response_cache[question_hash] = answers[question_hash]
+		
+		return answers
+	
+	def _serialized_user_context(self) -> Tuple[str, str]:
+		"""Prompt text for the user's experience and skills, rebuilt only when the context changes"""
+		user_context = self.rag_pipeline.user_context
+		key = (id(user_context), self.rag_pipeline.user_context_version)
+		if self._user_ctx_cached is None or self._user_ctx_cached[0] != key:
+			self._user_ctx_cached = (
+				key,
+				json.dumps(user_context.work_experience, indent=2),
+				', '.join(user_context.skills)
+			)
+		return self._user_ctx_cached[1], self._user_ctx_cached[2]
 	
 	def classify_question_type(self, question: str) -> str:
 		"""Classify the type of screening question"""
-		question_lower = question.lower()
-		
-		if any(word in question_lower for word in ["years", "experience", "long"]):
-			return "years_experience"
-		elif any(word in question_lower for word in ["salary", "compensation", "pay"]):
-			return "salary_expectation"
-		elif any(word in question_lower for word in ["start", "available", "when"]):
-			return "availability"
-		elif any(word in question_lower for word in ["authorized", "eligible", "visa"]):
-			return "work_authorization"
-		elif any(word in question_lower for word in ["relocate", "move", "location"]):
-			return "relocation"
-		elif any(word in question_lower for word in ["remote", "work from home"]):
-			return "remote_work"
-		else:
-			return "general"
+		question_hash = _fast_hash(question)
+		cached = self._classification_cache.get(question_hash)
+		if cached is not None:
+			return cached
+		
+		# Scan once, then pick the highest-priority category that matched
+		matched = {m.lastgroup for m in _QUESTION_TYPE_RE.finditer(question.lower())}
+		category = next((c for c, _ in _KEYWORD_GROUPS if c in matched), "general")
+		
+		self._classification_cache[question_hash] = category
+		return category
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str) -> List[str]:
+	"""Lowercased words of a job field or match pattern"""
+	return _WORD_RE.findall(text.lower())
+
+
+def _contains_phrase(words: List[str], phrase: List[str]) -> bool:
+	"""Whether phrase occurs in words as a run of consecutive whole words"""
+	n = len(phrase)
+	return n > 0 and any(words[i:i + n] == phrase for i in range(len(words) - n + 1))
 
 
 class WorkflowEngine:
 	"""Records, saves, and replays application workflows"""
 	
-	def __init__(self, storage_path: str = "./workflows"):
+	def __init__(self, storage_path: str = "./workflows", screening_handler: Optional[ScreeningHandler] = None):
 		self.storage_path = Path(storage_path)
 		self.storage_path.mkdir(exist_ok=True)
+		self.screening_handler = screening_handler
 		
 		self.templates: Dict[str, WorkflowTemplate] = {}
 		self.active_workflows: Dict[str, List[WorkflowStep]] = {}
 		self.recording_mode = False
 		
+		# Inverted indices from the first word of each match pattern to template ids,
+		# refreshed whenever a template is loaded or saved
+		self._by_company: Dict[str, Set[str]] = defaultdict(set)
+		self._by_job_type: Dict[str, Set[str]] = defaultdict(set)
+		self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+		self._index_keys: Dict[str, List[Tuple[Dict[str, Set[str]], str]]] = {}
+		
+		self._journal = JsonlJournal(self.storage_path / "templates.jsonl", self.templates.values)
 		self._load_templates()
 	
 	def _load_templates(self):
 		"""Load existing workflow templates"""
-		templates_file = self.storage_path / "templates.json"
-		if templates_file.exists():
-			with open(templates_file, 'r') as f:
-				data = json.load(f)
-				for template_data in data:
-					template = WorkflowTemplate(**template_data)
-					self.templates[template.id] = template
+		for template_data in self._journal.load().values():
+			template_data['steps'] = [
+				WorkflowStep(**{**step, 'step_type': WorkflowStepType(step['step_type'])})
+				for step in template_data.get('steps', [])
+			]
+			template_data['created_date'] = _parse_datetime(template_data['created_date'])
+			template_data['last_updated'] = _parse_datetime(template_data['last_updated'])
+			
+			template = WorkflowTemplate(**template_data)
+			self.templates[template.id] = template
+			self._index_template(template)
+	
+	def _index_template(self, template: WorkflowTemplate):
+		"""Add a template to the matching indices, replacing its previous entries"""
+		for index, key in self._index_keys.pop(template.id, ()):
+			index[key].discard(template.id)
+		
+		keys = []
+		for index, patterns in (
+			(self._by_company, [template.company_pattern]),
+			(self._by_job_type, [template.job_type_pattern]),
+			(self._by_tag, template.tags)
+		):
+			for pattern in patterns:
+				# Patterns match whole words, so a template is only reachable through its first word
+				words = _words(pattern)
+				if words:
+					index[words[0]].add(template.id)
+					keys.append((index, words[0]))
+		self._index_keys[template.id] = keys
 	
 	def save_templates(self):
-		"""Save workflow templates to storage"""
-		templates_file = self.storage_path / "templates.json"
-		data = [template.__dict__ for template in self.templates.values()]
-		
-		# Convert datetime objects to strings for JSON serialization
-		for template_data in data:
-			template_data['created_date'] = template_data['created_date'].isoformat()
-			template_data['last_updated'] = template_data['last_updated'].isoformat()
-		
-		with open(templates_file, 'w') as f:
-			json.dump(data, f, indent=2, default=str)
+		"""Save all workflow templates to storage, compacting the journal"""
+		for template in self.templates.values():
+			self._index_template(template)
+		self._journal.rewrite()
+	
+	def save_template(self, template: WorkflowTemplate):
+		"""Queue a single new or changed template for the next journal flush"""
+		self._index_template(template)
+		self._journal.append(template)
+	
+	def flush(self):
+		"""Write any queued template changes now"""
+		self._journal.flush()
 	
 	def start_recording_workflow(self, workflow_name: str) -> str:
 		"""Start recording a new workflow"""
@@ -348,7 +666,7 @@ class WorkflowEngine:
 		del self.active_workflows[workflow_id]
 		self.recording_mode = False
 		
-		self.save_templates()
+		self.save_template(template)
 		logging.info(f"Saved workflow template: {name}")
 		return template
 	
@@ -359,40 +677,68 @@ class WorkflowEngine:
 			return False
 		
 		template = self.templates[template_id]
-		logging.info(f"Replaying workflow: {template.name}")
+		logging.info("Replaying workflow: %s", template.name)
+		
+		# Start answering screening questions now so the LLM call overlaps earlier steps
+		screening_answers = self._prefetch_screening_answers(template, job_context)
 		
 		success = True
-		for step in template.steps:
-			try:
-				success = await self._execute_step(step, job_context)
-				if not success and step.required:
-					logging.error(f"Required step failed: {step.description}")
-					break
-				
-				# Wait between steps
-				await asyncio.sleep(step.delay_after)
-				
-			except Exception as e:
-				logging.error(f"Error executing step {step.description}: {e}")
-				if step.required:
-					success = False
-					break
+		try:
+			for step in template.steps:
+				try:
+					success = await self._execute_step(step, job_context, screening_answers)
+					if not success and step.required:
+						logging.error(f"Required step failed: {step.description}")
+						break
+					
+					# Wait between steps
+					await asyncio.sleep(step.delay_after)
+					
+				except Exception as e:
+					logging.error(f"Error executing step {step.description}: {e}")
+					if step.required:
+						success = False
+						break
+		finally:
+			# Stop generating answers for an abandoned application
+			if screening_answers is not None:
+				if not screening_answers.done():
+					screening_answers.cancel()
+				elif not screening_answers.cancelled():
+					# Mark a failure no step awaited as retrieved
+					screening_answers.exception()
 		
 		# Update template statistics
 		template.usage_count += 1
 		if success:
-			template.success_rate = (template.success_rate * (template.usage_count - 1) + 1) / template.usage_count
+			template.successes += 1
 		else:
-			template.success_rate = (template.success_rate * (template.usage_count - 1)) / template.usage_count
+			template.failures += 1
 		
 		template.last_updated = datetime.now()
-		self.save_templates()
+		self.save_template(template)
 		
 		return success
 	
-	async def _execute_step(self, step: WorkflowStep, job_context: JobPosting) -> bool:
+	def _prefetch_screening_answers(self, template: WorkflowTemplate, job_context: JobPosting) -> Optional[asyncio.Task]:
+		"""Answer the template's screening questions in the background, keyed by step id"""
+		screening_steps = [
+			step for step in template.steps
+			if step.step_type == WorkflowStepType.SCREENING_QUESTION
+		]
+		if self.screening_handler is None or not screening_steps:
+			return None
+		
+		async def answer_all() -> Dict[str, str]:
+			questions = [step.value or step.description for step in screening_steps]
+			answers = await self.screening_handler.handle_screening_questions(questions, job_context)
+			return {step.id: answer for step, answer in zip(screening_steps, answers)}
+		
+		return asyncio.create_task(answer_all())
+	
+	async def _execute_step(self, step: WorkflowStep, job_context: JobPosting, screening_answers: Optional[asyncio.Task] = None) -> bool:
 		"""Execute a single workflow step"""
-		logging.info(f"Executing step: {step.description}")
+		logging.info("Executing step: %s", step.description)
 		
 		# In real implementation, this would interact with browser APIs
 		# For demonstration, we simulate step execution
@@ -402,40 +748,54 @@ class WorkflowEngine:
 		elif step.step_type == WorkflowStepType.FILL_FORM:
 			return await self._simulate_form_fill(step.selector, step.value)
 		elif step.step_type == WorkflowStepType.SCREENING_QUESTION:
-			return await self._handle_screening_step(step, job_context)
+			return await self._handle_screening_step(step, job_context, screening_answers)
 		else:
-			logging.info(f"Simulated execution of {step.step_type}")
+			logging.info("Simulated execution of %s", step.step_type)
 			return True
 	
 	async def _simulate_click(self, selector: str) -> bool:
 		"""Simulate clicking an element"""
-		logging.info(f"Clicking element: {selector}")
+		logging.info("Clicking element: %s", selector)
 		await asyncio.sleep(0.5)  # Simulate action delay
 		return True
 	
 	async def _simulate_form_fill(self, selector: str, value: str) -> bool:
 		"""Simulate filling a form field"""
-		logging.info(f"Filling field {selector} with: {value}")
+		logging.info("Filling field %s with: %s", selector, value)
 		await asyncio.sleep(0.5)
 		return True
 	
-	async def _handle_screening_step(self, step: WorkflowStep, job_context: JobPosting) -> bool:
+	async def _handle_screening_step(self, step: WorkflowStep, job_context: JobPosting, screening_answers: Optional[asyncio.Task] = None) -> bool:
 		"""Handle screening question step"""
-		# This would integrate with ScreeningHandler
-		logging.info(f"Handling screening question: {step.description}")
-		return True
+		logging.info("Handling screening question: %s", step.description)
+		if screening_answers is None:
+			return True
+		
+		# Usually already resolved while earlier steps ran
+		answer = (await screening_answers).get(step.id)
+		return await self._simulate_form_fill(step.selector, answer)
 	
 	def find_matching_templates(self, job: JobPosting) -> List[WorkflowTemplate]:
 		"""Find workflow templates that match the job posting"""
-		matching = []
+		company = _words(job.company)
+		job_type = _words(job.job_type)
+		title = _words(job.title)
 		
-		for template in self.templates.values():
+		# Only templates whose pattern starts with one of the job's words can match
+		candidates: Set[str] = set()
+		for index, words in ((self._by_company, company), (self._by_job_type, job_type), (self._by_tag, title)):
+			for word in set(words):
+				candidates.update(index.get(word, ()))
+		
+		matching = []
+		for template_id in candidates:
+			template = self.templates[template_id]
 			# Simple matching logic - could be enhanced with ML
-			if template.company_pattern and template.company_pattern.lower() in job.company.lower():
+			if _contains_phrase(company, _words(template.company_pattern)):
 				matching.append(template)
-			elif template.job_type_pattern and template.job_type_pattern.lower() in job.job_type.lower():
+			elif _contains_phrase(job_type, _words(template.job_type_pattern)):
 				matching.append(template)
-			elif any(tag.lower() in job.title.lower() for tag in template.tags):
+			elif any(_contains_phrase(title, _words(tag)) for tag in template.tags):
 				matching.append(template)
 		
 		# Sort by success rate
@@ -451,73 +811,100 @@ class ApplicationTracker:
 		self.storage_path.mkdir(exist_ok=True)
 		
 		self.applications: Dict[str, ApplicationRecord] = {}
+		# Journal records not yet needed as objects; get_application materializes them
+		self._unloaded: Dict[str, Dict[str, Any]] = {}
+		
+		# Running aggregates over self.applications so polling checks don't rescan it
+		self._job_key_index: Set[str] = set()
+		self._applications_by_date: Counter[date] = Counter()
+		self._status_counts: Counter[ApplicationStatus] = Counter()
+		self._last_applied_at: Optional[datetime] = None
 		self.daily_limits = {
 			"max_applications_per_day": 50,  # Respectful limit
 			"min_delay_between_applications": 30  # seconds
 		}
 		
+		self._journal = JsonlJournal(self.storage_path / "applications.jsonl", self._all_records)
 		self._load_applications()
 	
 	def _load_applications(self):
-		"""Load existing application records"""
-		apps_file = self.storage_path / "applications.json"
-		if apps_file.exists():
-			with open(apps_file, 'r') as f:
-				data = json.load(f)
-				for app_data in data:
-					# Convert datetime strings back to datetime objects
-					app_data['applied_date'] = datetime.fromisoformat(app_data['applied_date'])
-					if app_data.get('application_deadline'):
-						app_data['application_deadline'] = datetime.fromisoformat(app_data['application_deadline'])
-					
-					app = ApplicationRecord(**app_data)
-					self.applications[app.id] = app
+		"""Load existing application records, indexing them without rehydrating"""
+		for app_id, app_data in self._journal.load().items():
+			self._unloaded[app_id] = app_data
+			self._index_application(ApplicationSummary.from_json(app_data))
+	
+	def _all_records(self) -> Iterable[Any]:
+		"""Every application, as a record or as its still-unloaded journal dict"""
+		yield from self.applications.values()
+		yield from self._unloaded.values()
+	
+	def get_application(self, app_id: str) -> Optional[ApplicationRecord]:
+		"""Get an application record, materializing it from the journal on first use"""
+		app = self.applications.get(app_id)
+		if app is None and app_id in self._unloaded:
+			app = self._materialize(self._unloaded.pop(app_id))
+			self.applications[app_id] = app
+		return app
+	
+	@staticmethod
+	def _materialize(app_data: Dict[str, Any]) -> ApplicationRecord:
+		"""Build an application record from its journal dict"""
+		# Convert nested records and datetime strings back to objects
+		job_data = app_data['job_posting']
+		job_data['posted_date'] = _parse_datetime(job_data['posted_date'])
+		job_data['application_deadline'] = _parse_datetime(job_data.get('application_deadline'))
+		app_data['job_posting'] = JobPosting(**job_data)
+		app_data['status'] = ApplicationStatus(app_data['status'])
+		app_data['applied_date'] = _parse_datetime(app_data['applied_date'])
+		app_data['follow_up_dates'] = [_parse_datetime(d) for d in app_data.get('follow_up_dates', [])]
+		return ApplicationRecord(**app_data)
+	
+	def _index_application(self, app: ApplicationSummary):
+		"""Add an application to the running aggregates"""
+		if app.job_key is not None:
+			self._job_key_index.add(app.job_key)
+		self._applications_by_date[app.applied_date.date()] += 1
+		self._status_counts[app.status] += 1
+		if self._last_applied_at is None or app.applied_date > self._last_applied_at:
+			self._last_applied_at = app.applied_date
 	
 	def save_applications(self):
-		"""Save application records to storage"""
-		apps_file = self.storage_path / "applications.json"
-		data = []
-		
-		for app in self.applications.values():
-			app_data = app.__dict__.copy()
-			app_data['applied_date'] = app_data['applied_date'].isoformat()
-			if app_data.get('application_deadline'):
-				app_data['application_deadline'] = app_data['application_deadline'].isoformat()
-			data.append(app_data)
-		
-		with open(apps_file, 'w') as f:
-			json.dump(data, f, indent=2, default=str)
+		"""Save all application records to storage, compacting the journal"""
+		self._journal.rewrite()
+	
+	def _save_application(self, app: ApplicationRecord):
+		"""Queue a single new or changed application record for the next journal flush"""
+		self._journal.append(app)
 	
-	def can_apply_today(self) -> bool:
+	def flush(self):
+		"""Write any queued application changes now"""
+		self._journal.flush()
+	
+	def can_apply_today(self, now: Optional[datetime] = None) -> bool:
 		"""Check if daily application limit allows more applications"""
-		today = datetime.now().date()
-		today_applications = [
-			app for app in self.applications.values()
-			if app.applied_date.date() == today
-		]
-		
-		return len(today_applications) < self.daily_limits["max_applications_per_day"]
+		today = (now or datetime.now()).date()
+		return self._applications_by_date[today] < self.daily_limits["max_applications_per_day"]
 	
 	def get_last_application_time(self) -> Optional[datetime]:
 		"""Get timestamp of last application"""
-		if not self.applications:
-			return None
-		
-		return max(app.applied_date for app in self.applications.values())
+		return self._last_applied_at
 	
-	def should_wait_before_next_application(self) -> bool:
+	def should_wait_before_next_application(self, now: Optional[datetime] = None) -> bool:
 		"""Check if we should wait before next application"""
 		last_app_time = self.get_last_application_time()
 		if not last_app_time:
 			return False
 		
-		time_since_last = datetime.now() - last_app_time
+		time_since_last = (now or datetime.now()) - last_app_time
 		min_delay = timedelta(seconds=self.daily_limits["min_delay_between_applications"])
 		
 		return time_since_last < min_delay
 	
 	def record_application(self, job: JobPosting, workflow_id: str) -> ApplicationRecord:
 		"""Record a new job application"""
+		if not job.id:
+			job.id = uuid7str()
+		
 		app = ApplicationRecord(
 			job_posting=job,
 			workflow_used=workflow_id,
@@ -525,32 +912,32 @@ class ApplicationTracker:
 		)
 		
 		self.applications[app.id] = app
-		self.save_applications()
+		self._index_application(ApplicationSummary.from_record(app))
+		self._save_application(app)
 		
-		logging.info(f"Recorded application: {job.title} at {job.company}")
+		logging.info("Recorded application: %s at %s", job.title, job.company)
 		return app
 	
+	def has_applied_to(self, job: JobPosting) -> bool:
+		"""Check if an application was already recorded for this company and title"""
+		return _job_key(job) in self._job_key_index
+	
 	def update_application_status(self, app_id: str, status: ApplicationStatus, notes: str = ""):
 		"""Update application status"""
-		if app_id in self.applications:
-			self.applications[app_id].status = status
+		app = self.get_application(app_id)
+		if app is not None:
+			self._status_counts[app.status] -= 1
+			self._status_counts[status] += 1
+			app.status = status
 			if notes:
-				self.applications[app_id].notes += f"\n{datetime.now()}: {notes}"
-			self.save_applications()
+				app.notes += f"\n{datetime.now()}: {notes}"
+			self._save_application(app)
 	
-	def get_applications_summary(self) -> Dict[str, Any]:
+	def get_applications_summary(self, now: Optional[datetime] = None) -> Dict[str, Any]:
 		"""Get summary of applications"""
-		total = len(self.applications)
-		by_status = {}
-		
-		for app in self.applications.values():
-			status = app.status
-			by_status[status] = by_status.get(status, 0) + 1
-		
-		today_count = len([
-			app for app in self.applications.values()
-			if app.applied_date.date() == datetime.now().date()
-		])
+		total = len(self.applications) + len(self._unloaded)
+		by_status = {status: count for status, count in self._status_counts.items() if count}
+		today_count = self._applications_by_date[(now or datetime.now()).date()]
 		
 		return {
 			"total_applications": total,
@@ -570,11 +957,13 @@ class LinkedInWorkflowAutomation:
 			gpt_agent.rag_pipeline, 
 			gpt_agent.ollama_client
 		)
-		self.workflow_engine = WorkflowEngine()
+		self.workflow_engine = WorkflowEngine(screening_handler=self.screening_handler)
 		self.application_tracker = ApplicationTracker()
 		
 		self.is_active = False
 		self.automation_callbacks: List[Callable] = []
+		self.url_changed_event = asyncio.Event()
+		self._loop: Optional[asyncio.AbstractEventLoop] = None
 	
 	def register_automation_callback(self, callback: Callable):
 		"""Register callback for automation events"""
@@ -585,17 +974,23 @@ class LinkedInWorkflowAutomation:
 		logging.info("Starting LinkedIn Easy Apply automation...")
 		
 		self.is_active = True
+		self._loop = asyncio.get_running_loop()
 		
-		# Start monitoring for LinkedIn pages
+		# Check LinkedIn pages whenever the browser reports a navigation
 		while self.is_active:
 			try:
 				await self._check_for_linkedin_opportunities()
-				await asyncio.sleep(5)  # Check every 5 seconds
+				await wait_for_change(self.url_changed_event)
 				
 			except Exception as e:
 				logging.error(f"Error in automation loop: {e}")
 				await asyncio.sleep(10)  # Wait longer on error
 	
+	def notify_url_changed(self):
+		"""Wake the automation loop after a navigation; safe to call from any thread"""
+		if self._loop is not None:
+			self._loop.call_soon_threadsafe(self.url_changed_event.set)
+	
 	async def _check_for_linkedin_opportunities(self):
 		"""Check current page for LinkedIn Easy Apply opportunities"""
 		# In real implementation, this would check the actual browser URL
@@ -604,38 +999,34 @@ class LinkedInWorkflowAutomation:
 		if await self.linkedin_detector.is_linkedin_job_page(current_url):
 			jobs = await self.linkedin_detector.detect_easy_apply_opportunity()
 			
+			# One timestamp for every check in this tick
+			now = datetime.now()
 			for job in jobs:
-				if self._should_apply_to_job(job):
+				if self._should_apply_to_job(job, now):
 					await self.apply_to_job(job)
 	
-	def _should_apply_to_job(self, job: JobPosting) -> bool:
+	def _should_apply_to_job(self, job: JobPosting, now: Optional[datetime] = None) -> bool:
 		"""Determine if we should apply to this job"""
+		# Check if already applied first; it rejects most jobs seen more than once
+		if self.application_tracker.has_applied_to(job):
+			logging.info("Already applied to %s at %s", job.title, job.company)
+			return False
+		
 		# Check daily limits
-		if not self.application_tracker.can_apply_today():
+		if not self.application_tracker.can_apply_today(now):
 			logging.info("Daily application limit reached")
 			return False
 		
 		# Check timing between applications
-		if self.application_tracker.should_wait_before_next_application():
+		if self.application_tracker.should_wait_before_next_application(now):
 			logging.info("Waiting before next application")
 			return False
 		
-		# Check if already applied
-		job_hash = hashlib.md5(f"{job.company}_{job.title}".encode()).hexdigest()
-		existing_apps = [
-			app for app in self.application_tracker.applications.values()
-			if hashlib.md5(f"{app.job_posting.company}_{app.job_posting.title}".encode()).hexdigest() == job_hash
-		]
-		
-		if existing_apps:
-			logging.info(f"Already applied to {job.title} at {job.company}")
-			return False
-		
 		return True
 	
 	async def apply_to_job(self, job: JobPosting) -> bool:
 		"""Apply to a job using saved workflows"""
-		logging.info(f"Applying to: {job.title} at {job.company}")
+		logging.info("Applying to: %s at %s", job.title, job.company)
 		
 		# Find matching workflow templates
 		matching_templates = self.workflow_engine.find_matching_templates(job)
@@ -647,7 +1038,7 @@ class LinkedInWorkflowAutomation:
 		
 		# Use the best matching template
 		best_template = matching_templates[0]
-		logging.info(f"Using workflow template: {best_template.name}")
+		logging.info("Using workflow template: %s", best_template.name)
 		
 		# Execute the workflow
 		success = await self.workflow_engine.replay_workflow(best_template.id, job)
@@ -707,7 +1098,7 @@ class LinkedInWorkflowAutomation:
 		template.company_pattern = job.company
 		template.job_type_pattern = job.job_type
 		
-		self.workflow_engine.save_templates()
+		self.workflow_engine.save_template(template)
 		
 		return True
 	
@@ -744,6 +1135,12 @@ class LinkedInWorkflowAutomation:
 		"""Stop LinkedIn automation"""
 		logging.info("Stopping LinkedIn automation...")
 		self.is_active = False
+		# Wake the loop so it exits without waiting for the heartbeat
+		self.notify_url_changed()
+		
+		# Persist changes still waiting on a delayed flush
+		self.workflow_engine.flush()
+		self.application_tracker.flush()
 
 
 # Integration with the main GPT Agent
@@ -801,9 +1198,8 @@ async def main():
 		gpt_agent, linkedin_automation = await integrate_with_gpt_agent()
 		
 		# Keep running until stopped
-		while gpt_agent.is_active:
-			await asyncio.sleep(1)
-			
+		await gpt_agent.wait_until_stopped()
+		
 	except KeyboardInterrupt:
 		logging.info("Received interrupt signal")
 	finally:
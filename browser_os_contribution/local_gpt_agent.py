@@ -16,13 +16,20 @@ Architecture:
 """
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Callable
+import pickle
+import re
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple, Callable
 from pathlib import Path
-import speech_recognition as sr
+import vosk
 import chromadb
+import numpy as np
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 from pydantic import BaseModel, Field, ConfigDict
 from uuid_extensions import uuid7str
 import ollama
@@ -30,6 +37,34 @@ import pyaudio
 import threading
 from enum import Enum
 
+try:
+	import msgpack
+	import zstandard
+except ImportError:
+	msgpack = zstandard = None
+
+# Local LLMs served by Ollama: the small model handles intents and short fields,
+# the larger one open-ended text such as cover letters and screening answers
+FAST_MODEL = "llama3.2:1b-instruct-q4_K_M"
+MAIN_MODEL = "llama3.2:3b-instruct-q4_K_M"
+# Keep the model resident between requests instead of unloading it when idle
+OLLAMA_KEEP_ALIVE = -1
+# Prompts stay well under 2048 tokens; a smaller context window halves the KV cache
+OLLAMA_OPTIONS = {"num_ctx": 2048}
+
+# Metadata marker for form patterns stored as base64 zstd-compressed msgpack
+PATTERN_ENCODING = "zstd+msgpack"
+
+# Local speech recognition model, from https://alphacephei.com/vosk/models
+VOSK_MODEL_PATH = "./models/vosk-model-small-en-us-0.15"
+ASR_SAMPLE_RATE = 16000
+# 20 ms of 16-bit mono audio per microphone callback
+AUDIO_FRAMES_PER_BUFFER = 320
+# Callback chunks held while the recognizer catches up (~10 s); the oldest are dropped first
+AUDIO_RING_SIZE = 500
+# Seconds the listener waits on a voice command; speech buffered beyond that is dropped as stale
+VOICE_COMMAND_TIMEOUT = 10.0
+
 
 class FormFieldType(str, Enum):
 	"""Enum for different types of form fields"""
@@ -55,7 +90,110 @@ class IntentType(str, Enum):
 	STOP_WATCHING = "stop_watching"
 
 
-@dataclass
+# Whole-phrase rules for common voice commands, checked in order before asking the LLM.
+# Rules match the entire utterance so a keyword inside a longer sentence ("don't stop",
+# "stop scrolling") goes to the LLM instead of triggering a command
+_INTENT_RULES = [
+	(re.compile(r"^\s*(please\s+)?auto[\s-]?fill(\s+(this|the|my))?(\s+(form|page|information|details))?\s*$", re.I), IntentType.AUTO_FILL),
+	(re.compile(r"^\s*(please\s+)?fill(\s+(it|out|in))?(\s+(this|the))?(\s+(form|page))?\s*$", re.I), IntentType.FILL_FORM),
+	(re.compile(r"^\s*(please\s+)?save(\s+(this|the))?(\s+(workflow|form))?\s*$", re.I), IntentType.SAVE_WORKFLOW),
+	(re.compile(r"^\s*(please\s+)?(clear|reset)(\s+(this|the))?(\s+(form|page))?\s*$", re.I), IntentType.CLEAR_FORM),
+	(re.compile(r"^\s*(please\s+)?(stop|quit)(\s+(listening|watching))?\s*$", re.I), IntentType.STOP_WATCHING),
+	(re.compile(r"^\s*(help|what can you do)\s*$", re.I), IntentType.HELP),
+]
+
+
+def _match_intent(text: str) -> Optional[IntentType]:
+	"""Classify a command by whole-phrase rules; None when no rule applies"""
+	for pattern, intent in _INTENT_RULES:
+		if pattern.search(text):
+			return intent
+	return None
+
+
+# Fixed instructions for LLM intent classification, sent as the system prompt so
+# the model keeps them in its prompt cache between commands
+_INTENT_SYSTEM_PROMPT = """Analyze the voice command and return JSON with intent and parameters.
+
+Available intents: fill_form, auto_fill, save_workflow, clear_form, help, stop_watching
+
+Return format:
+{"intent": "intent_name", "parameters": {"key": "value"}}
+
+Examples:
+"Fill out this form" -> {"intent": "fill_form", "parameters": {}}
+"Auto fill my information" -> {"intent": "auto_fill", "parameters": {}}
+"Save this workflow" -> {"intent": "save_workflow", "parameters": {}}"""
+
+# Form domains recognized from field labels, checked in order
+_DOMAIN_RULES = [
+	(re.compile(r"\b(job|resume|career|linkedin)", re.I), "job_application"),
+	(re.compile(r"\b(address|shipping|billing)", re.I), "address_form"),
+]
+
+
+def _encode_pattern(structure: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+	"""Encode a form pattern as a Chroma document; returns the document and its encoding marker"""
+	if msgpack is None:
+		return json.dumps(structure), None
+	packed = zstandard.ZstdCompressor(level=3).compress(msgpack.packb(structure))
+	return base64.b64encode(packed).decode('ascii'), PATTERN_ENCODING
+
+
+def _decode_pattern(document: str, encoding: Optional[str]) -> Optional[Dict[str, Any]]:
+	"""Turn a stored form pattern document back into its structure; None if it can't be decoded here"""
+	if encoding != PATTERN_ENCODING:
+		return json.loads(document)
+	if msgpack is None or zstandard is None:
+		logging.warning("msgpack/zstandard not available, skipping compressed form pattern")
+		return None
+	packed = zstandard.ZstdDecompressor().decompress(base64.b64decode(document))
+	return msgpack.unpackb(packed)
+
+
+async def _generate_json(ollama_client, model: str, prompt: str, system: Optional[str] = None) -> Any:
+	"""Stream a JSON completion and stop decoding once the top-level array or object closes"""
+	stream = await ollama_client.generate(
+		model=model,
+		prompt=prompt,
+		system=system,
+		format='json',
+		stream=True,
+		keep_alive=OLLAMA_KEEP_ALIVE,
+		options=OLLAMA_OPTIONS
+	)
+	received = []
+	depth = 0
+	in_string = escaped = False
+	try:
+		async for chunk in stream:
+			piece = chunk['response']
+			for i, char in enumerate(piece):
+				if in_string:
+					if escaped:
+						escaped = False
+					elif char == '\\':
+						escaped = True
+					elif char == '"':
+						in_string = False
+				elif char == '"':
+					in_string = True
+				elif char in '[{':
+					depth += 1
+				elif char in ']}':
+					depth -= 1
+					if depth == 0:
+						received.append(piece[:i + 1])
+						return json.loads("".join(received))
+			received.append(piece)
+	finally:
+		# Closing the generator releases the HTTP response, which stops generation server-side
+		await stream.aclose()
+	
+	return json.loads("".join(received))
+
+
+@dataclass(slots=True)
 class FormField:
 	"""Represents a detected form field"""
 	id: str
@@ -69,9 +207,11 @@ class FormField:
 	confidence: float
 
 
-@dataclass
-class UserContext:
+class UserContext(BaseModel):
 	"""User's personal context for form filling"""
+	# Keeps extra profile sections such as social_profiles written by the setup script
+	model_config = ConfigDict(extra='allow')
+	
 	id: str = Field(default_factory=uuid7str)
 	full_name: str = ""
 	email: str = ""
@@ -87,16 +227,43 @@ class UserContext:
 class VoiceProcessor:
 	"""Handles voice recognition and intent parsing"""
 	
-	def __init__(self, ollama_client):
-		self.recognizer = sr.Recognizer()
-		self.microphone = sr.Microphone()
+	def __init__(self, ollama_client, model_path: str = VOSK_MODEL_PATH):
 		self.ollama_client = ollama_client
 		self.is_listening = False
 		self.intent_callbacks: Dict[IntentType, Callable] = {}
+		self._loop: Optional[asyncio.AbstractEventLoop] = None
+		self._audio_chunks = deque(maxlen=AUDIO_RING_SIZE)
+		self._audio_ready = threading.Event()
+		self.asr = None
+		self._audio = None
+		self._stream = None
 		
-		# Calibrate microphone
-		with self.microphone as source:
-			self.recognizer.adjust_for_ambient_noise(source)
+		try:
+			# Recognize on-device so audio never leaves the machine and there's no network round trip
+			self.asr = vosk.KaldiRecognizer(vosk.Model(model_path), ASR_SAMPLE_RATE)
+			
+			# One callback stream for the session; PortAudio fills the ring buffer from its own thread
+			self._audio = pyaudio.PyAudio()
+			self._stream = self._audio.open(
+				format=pyaudio.paInt16,
+				channels=1,
+				rate=ASR_SAMPLE_RATE,
+				input=True,
+				frames_per_buffer=AUDIO_FRAMES_PER_BUFFER,
+				stream_callback=self._on_audio,
+				start=False
+			)
+		except Exception as e:
+			# A missing speech model or microphone shouldn't keep the rest of the agent from running
+			logging.error(f"Voice input unavailable, continuing without it: {e}")
+			if self._audio is not None:
+				self._audio.terminate()
+				self._audio = None
+	
+	@property
+	def is_available(self) -> bool:
+		"""Whether a speech model and microphone stream were set up"""
+		return self._stream is not None
 	
 	def register_intent_callback(self, intent: IntentType, callback: Callable):
 		"""Register callback for specific voice intents"""
@@ -104,25 +271,39 @@ class VoiceProcessor:
 	
 	async def start_listening(self):
 		"""Start continuous voice recognition"""
+		if not self.is_available:
+			logging.warning("Voice input unavailable, not listening")
+			return
+		
+		# The listener thread hands recognized commands back to this loop
+		self._loop = asyncio.get_running_loop()
 		self.is_listening = True
+		self._audio_chunks.clear()
+		self._stream.start_stream()
 		
 		def listen_worker():
 			while self.is_listening:
+				if not self._audio_ready.wait(timeout=1):
+					continue
+				self._audio_ready.clear()
+				
 				try:
-					with self.microphone as source:
-						# Listen for audio with timeout
-						audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
+					while self._audio_chunks:
+						# Convert speech to text
+						text = self._transcribe(self._audio_chunks.popleft())
+						if not text:
+							continue
+						
+						# Parse intent on the agent's loop; wait so commands never pile up behind slow inference
+						future = asyncio.run_coroutine_threadsafe(self._process_voice_command(text), self._loop)
+						try:
+							future.result(timeout=VOICE_COMMAND_TIMEOUT)
+						except TimeoutError:
+							# The command keeps running; only speech captured while it ran is stale
+							self._audio_chunks.clear()
+							self.asr.Reset()
+							logging.warning(f"Voice command still running, dropped buffered speech: {text}")
 					
-					# Convert speech to text
-					text = self.recognizer.recognize_google(audio)
-					
-					# Parse intent using local LLM
-					asyncio.create_task(self._process_voice_command(text))
-					
-				except sr.WaitTimeoutError:
-					continue
-				except sr.UnknownValueError:
-					continue
 				except Exception as e:
 					logging.error(f"Voice processing error: {e}")
 		
@@ -131,33 +312,27 @@ class VoiceProcessor:
 		thread.daemon = True
 		thread.start()
 	
+	def _on_audio(self, in_data, frame_count, time_info, status):
+		"""PyAudio stream callback; queues the chunk without blocking the audio thread"""
+		self._audio_chunks.append(in_data)
+		self._audio_ready.set()
+		return None, pyaudio.paContinue
+	
+	def _transcribe(self, chunk: bytes) -> str:
+		"""Feed a chunk to the recognizer; returns text once Vosk detects the end of an utterance"""
+		# Vosk's endpointing acts as the voice activity gate: silence never completes an utterance
+		if not self.asr.AcceptWaveform(chunk):
+			return ""
+		return json.loads(self.asr.Result()).get('text', '')
+	
 	async def _process_voice_command(self, text: str):
-		"""Process voice command using local LLM for intent recognition"""
-		prompt = f"""
-		Analyze this voice command and return JSON with intent and parameters:
-		Command: "{text}"
-		
-		Available intents: fill_form, auto_fill, save_workflow, clear_form, help, stop_watching
-		
-		Return format:
-		{{"intent": "intent_name", "parameters": {{"key": "value"}}}}
-		
-		Examples:
-		"Fill out this form" -> {{"intent": "fill_form", "parameters": {{}}}}
-		"Auto fill my information" -> {{"intent": "auto_fill", "parameters": {{}}}}
-		"Save this workflow" -> {{"intent": "save_workflow", "parameters": {{}}}}
-		"""
-		
+		"""Process voice command, using the local LLM only when no keyword rule matches"""
 		try:
-			response = self.ollama_client.generate(
-				model='llama3.2',
-				prompt=prompt,
-				format='json'
-			)
-			
-			intent_data = json.loads(response['response'])
-			intent = IntentType(intent_data['intent'])
-			parameters = intent_data.get('parameters', {})
+			intent = _match_intent(text)
+			if intent is not None:
+				parameters = {}
+			else:
+				intent, parameters = await self._classify_intent_with_llm(text)
 			
 			# Execute callback if registered
 			if intent in self.intent_callbacks:
@@ -166,118 +341,368 @@ class VoiceProcessor:
 		except Exception as e:
 			logging.error(f"Intent processing error: {e}")
 	
+	async def _classify_intent_with_llm(self, text: str) -> Tuple[IntentType, Dict[str, Any]]:
+		"""Recognize the intent and parameters of a free-form command with the local LLM"""
+		# Only the command is new per call; the fixed instructions ride in the cached system prompt
+		intent_data = await _generate_json(
+			self.ollama_client, FAST_MODEL, f'Command: "{text}"', system=_INTENT_SYSTEM_PROMPT
+		)
+		return IntentType(intent_data['intent']), intent_data.get('parameters', {})
+	
 	def stop_listening(self):
 		"""Stop voice recognition"""
 		self.is_listening = False
+		if self.is_available:
+			self._stream.stop_stream()
+		self._audio_ready.set()
 
 
 class RAGPipeline:
 	"""Retrieval-Augmented Generation pipeline for contextual form filling"""
 	
+	# Maximum number of cached query embeddings
+	EMBEDDING_CACHE_SIZE = 4096
+	
+	# Field types answered straight from the user context without retrieval or the LLM
+	DETERMINISTIC_FIELD_TYPES = frozenset({FormFieldType.NAME, FormFieldType.EMAIL, FormFieldType.PHONE})
+	# Fields per suggestion prompt; larger forms are split and the prompts run concurrently
+	SUGGESTION_BATCH_SIZE = 8
+	
+	# Past answers from retrieved form patterns included in a suggestion prompt
+	PAST_ANSWER_LIMIT = 20
+	
 	def __init__(self, context_db_path: str = "./context_db"):
 		self.context_db_path = Path(context_db_path)
 		self.context_db_path.mkdir(exist_ok=True)
 		
+		# all-MiniLM-L6-v2 on ONNX Runtime, shared by Chroma and query embedding
+		self.embedding_function = ONNXMiniLM_L6_V2()
+		# Warm up now so the first user query doesn't pay the model load
+		self.embedding_function(["warmup"])
+		
+		# Query embeddings keyed by SHA-256 of the normalized text, in LRU order
+		self._embedding_cache_path = self.context_db_path / "embed_cache.pkl"
+		self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+		# Pattern queries run in worker threads, so concurrent batches share the cache
+		self._embedding_lock = threading.Lock()
+		self._load_embedding_cache()
+		
 		# Initialize ChromaDB for vector storage
 		self.chroma_client = chromadb.PersistentClient(path=str(self.context_db_path))
 		self.context_collection = self.chroma_client.get_or_create_collection(
 			name="user_context",
-			metadata={"hnsw:space": "cosine"}
+			metadata={"hnsw:space": "cosine"},
+			embedding_function=self.embedding_function
 		)
 		self.form_patterns_collection = self.chroma_client.get_or_create_collection(
 			name="form_patterns",
-			metadata={"hnsw:space": "cosine"}
+			metadata={"hnsw:space": "cosine"},
+			embedding_function=self.embedding_function
 		)
 		
+		# Chroma stays the source of truth; its pattern embeddings are mirrored here as
+		# L2-normalized rows so similarity search is a single matrix product
+		self._pattern_ids: List[str] = []
+		self._pattern_documents: List[str] = []
+		self._pattern_encodings: List[Optional[str]] = []
+		self._pattern_matrix: Optional[np.ndarray] = None
+		self._load_pattern_index()
+		
+		self.user_context_path = self.context_db_path / "user_context.json"
 		self.user_context = UserContext()
+		# Bumped whenever user_context is loaded or saved so consumers can cache derived text
+		self.user_context_version = 0
+		self._user_context_prompt: Optional[Tuple[int, str]] = None
 		self._load_user_context()
 	
 	def _load_user_context(self):
 		"""Load user context from storage"""
-		context_path = self.context_db_path / "user_context.json"
-		if context_path.exists():
-			with open(context_path, 'r') as f:
-				data = json.load(f)
-				self.user_context = UserContext(**data)
+		if self.user_context_path.exists():
+			self.user_context = UserContext.model_validate_json(self.user_context_path.read_bytes())
+			self.user_context_version += 1
 	
 	def save_user_context(self):
 		"""Save user context to storage"""
-		context_path = self.context_db_path / "user_context.json"
-		with open(context_path, 'w') as f:
-			json.dump(self.user_context.__dict__, f, indent=2)
+		self.user_context_version += 1
+		# Stays indented so the profile remains easy to read and edit by hand
+		self.user_context_path.write_text(self.user_context.model_dump_json(indent=2), encoding='utf-8')
+		
+		self._save_embedding_cache()
+	
+	def _load_embedding_cache(self):
+		"""Reload query embeddings computed in earlier sessions"""
+		if self._embedding_cache_path.exists():
+			try:
+				with open(self._embedding_cache_path, 'rb') as f:
+					self._embedding_cache.update(pickle.load(f))
+			except Exception as e:
+				logging.warning(f"Ignoring unreadable embedding cache: {e}")
+	
+	def _save_embedding_cache(self):
+		"""Persist query embeddings so the next session starts warm"""
+		with self._embedding_lock:
+			snapshot = dict(self._embedding_cache)
+		with open(self._embedding_cache_path, 'wb') as f:
+			pickle.dump(snapshot, f)
+	
+	def _embed_queries(self, texts: List[str]) -> List[List[float]]:
+		"""Embed query texts, encoding only those not already cached"""
+		# Embed the same normalized text the key is derived from, so a cached vector
+		# doesn't depend on which casing or spacing was seen first
+		normalized = [text.strip().lower() for text in texts]
+		keys = [hashlib.sha256(text.encode()).hexdigest() for text in normalized]
+		
+		with self._embedding_lock:
+			misses = {key: text for key, text in zip(keys, normalized) if key not in self._embedding_cache}
+			
+			if misses:
+				vectors = np.asarray(self.embedding_function(list(misses.values())), dtype=np.float32)
+				for key, vector in zip(misses, vectors):
+					self._embedding_cache[key] = vector.tolist()
+			
+			embeddings = []
+			for key in keys:
+				self._embedding_cache.move_to_end(key)
+				embeddings.append(self._embedding_cache[key])
+			
+			while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+				self._embedding_cache.popitem(last=False)
+		return embeddings
+	
+	def user_context_prompt(self) -> str:
+		"""System prompt carrying the user context, built once per context version"""
+		if self._user_context_prompt is None or self._user_context_prompt[0] != self.user_context_version:
+			self._user_context_prompt = (
+				self.user_context_version,
+				"You suggest values for web form fields on behalf of the user described below.\n\n"
+				f"User Context: {self.user_context.model_dump_json(indent=2)}"
+			)
+		return self._user_context_prompt[1]
+	
+	def _load_pattern_index(self):
+		"""Mirror stored form pattern embeddings into the in-memory index"""
+		stored = self.form_patterns_collection.get(include=['embeddings', 'documents', 'metadatas'])
+		if len(stored['ids']):
+			self._pattern_ids = list(stored['ids'])
+			# Documents stay encoded until a query returns them
+			self._pattern_documents = list(stored['documents'])
+			self._pattern_encodings = [(meta or {}).get("encoding") for meta in stored['metadatas']]
+			self._pattern_matrix = self._normalize(np.asarray(stored['embeddings'], dtype=np.float32))
+	
+	@staticmethod
+	def _normalize(vectors: np.ndarray) -> np.ndarray:
+		"""Scale rows to unit length so dot products are cosine similarities"""
+		norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+		return vectors / np.maximum(norms, 1e-12)
+	
+	def _query_patterns(self, texts: List[str], n_results: int = 3) -> Dict[str, List[List[Any]]]:
+		"""Most similar stored form patterns for each text, shaped like a Chroma query result with decoded documents"""
+		result: Dict[str, List[List[Any]]] = {"ids": [], "documents": [], "distances": []}
+		if self._pattern_matrix is None:
+			for key in result:
+				result[key] = [[] for _ in texts]
+			return result
+		
+		queries = self._normalize(np.asarray(self._embed_queries(texts), dtype=np.float32))
+		scores = queries @ self._pattern_matrix.T
+		k = min(n_results, scores.shape[1])
+		
+		for row in scores:
+			top = np.argpartition(-row, k - 1)[:k]
+			top = top[np.argsort(-row[top])]
+			result["ids"].append([self._pattern_ids[i] for i in top])
+			result["documents"].append([
+				_decode_pattern(self._pattern_documents[i], self._pattern_encodings[i]) for i in top
+			])
+			result["distances"].append((1.0 - row[top]).tolist())
+		return result
 	
 	def add_form_pattern(self, form_fields: List[FormField], filled_values: Dict[str, str]):
-		"""Learn from successful form completions"""
-		pattern_id = uuid7str()
-		
-		# Create embeddings for form structure
-		form_structure = {
-			"fields": [f.__dict__ for f in form_fields],
-			"values": filled_values,
-			"domain": self._extract_domain_from_fields(form_fields)
-		}
+		"""Learn from a successful form completion"""
+		self.add_form_patterns([(form_fields, filled_values)])
+	
+	def add_form_patterns(self, completions: List[Tuple[List[FormField], Dict[str, str]]]):
+		"""Learn from several successful form completions with one embedding pass and one insert"""
+		if not completions:
+			return
+		
+		pattern_ids = []
+		texts = []
+		documents = []
+		metadatas = []
+		for form_fields, filled_values in completions:
+			# Create embeddings for form structure
+			form_structure = {
+				"fields": [asdict(f) for f in form_fields],
+				"values": filled_values,
+				"domain": self._extract_domain_from_fields(form_fields)
+			}
+			pattern_id = uuid7str()
+			document, encoding = _encode_pattern(form_structure)
+			metadata = {"pattern_id": pattern_id, "success": True}
+			if encoding:
+				metadata["encoding"] = encoding
+			
+			pattern_ids.append(pattern_id)
+			texts.append(json.dumps(form_structure))
+			documents.append(document)
+			metadatas.append(metadata)
+		
+		# Embed the readable JSON; only the stored document is compacted
+		embeddings = np.asarray(self.embedding_function(texts), dtype=np.float32)
 		
 		self.form_patterns_collection.add(
-			documents=[json.dumps(form_structure)],
-			metadatas=[{"pattern_id": pattern_id, "success": True}],
-			ids=[pattern_id]
+			documents=documents,
+			embeddings=embeddings.tolist(),
+			metadatas=metadatas,
+			ids=pattern_ids
 		)
+		
+		# Keep the in-memory index in step with Chroma
+		embeddings = self._normalize(embeddings)
+		self._pattern_ids.extend(pattern_ids)
+		self._pattern_documents.extend(documents)
+		self._pattern_encodings.extend(metadata.get("encoding") for metadata in metadatas)
+		if self._pattern_matrix is None:
+			self._pattern_matrix = embeddings
+		else:
+			self._pattern_matrix = np.concatenate([self._pattern_matrix, embeddings])
 	
 	def _extract_domain_from_fields(self, fields: List[FormField]) -> str:
 		"""Extract domain/context from form fields"""
-		labels = " ".join([f.label for f in fields])
+		labels = " ".join(f.label for f in fields)
 		# Simple domain classification - could be enhanced with ML
-		if any(keyword in labels.lower() for keyword in ["job", "resume", "career", "linkedin"]):
-			return "job_application"
-		elif any(keyword in labels.lower() for keyword in ["address", "shipping", "billing"]):
-			return "address_form"
-		else:
-			return "general"
+		for pattern, domain in _DOMAIN_RULES:
+			if pattern.search(labels):
+				return domain
+		return "general"
 	
 	async def get_field_suggestions(self, field: FormField, ollama_client) -> List[str]:
 		"""Get AI-powered suggestions for form field"""
-		
-		# Retrieve similar form patterns
-		similar_patterns = self.form_patterns_collection.query(
-			query_texts=[f"{field.label} {field.field_type}"],
-			n_results=3
-		)
-		
-		context = {
-			"user_context": self.user_context.__dict__,
-			"field": field.__dict__,
-			"similar_patterns": similar_patterns
-		}
-		
-		prompt = f"""
-		Based on the user context and form field, suggest appropriate values:
-		
-		User Context: {json.dumps(context['user_context'], indent=2)}
-		
-		Form Field: {json.dumps(context['field'], indent=2)}
-		
-		Field Type: {field.field_type}
-		Field Label: {field.label}
-		Placeholder: {field.placeholder}
-		
-		Provide 1-3 contextually appropriate suggestions for this field.
-		Return as JSON array: ["suggestion1", "suggestion2"]
-		"""
+		known = self._deterministic_suggestions(field)
+		if known:
+			return known
 		
 		try:
-			response = ollama_client.generate(
-				model='llama3.2',
-				prompt=prompt,
-				format='json'
+			# Retrieve similar form patterns; embedding and scoring are CPU-bound, so keep them off the loop
+			similar_patterns = await asyncio.to_thread(
+				self._query_patterns, [f"{field.label} {field.field_type}"], 3
 			)
 			
-			suggestions = json.loads(response['response'])
+			# The user context travels as the shared system prompt, so Ollama reuses its cached
+			# prefix and only the field below is evaluated per request
+			prompt = f"""
+			Based on the user context and form field, suggest appropriate values.
+			Provide 1-3 contextually appropriate suggestions for the field.
+			Return as JSON array: ["suggestion1", "suggestion2"]
+			
+			Answers from similar forms filled before:
+			{self._past_answers(similar_patterns)}
+			
+			Form Field: {json.dumps(asdict(field), indent=2)}
+			
+			Field Type: {field.field_type}
+			Field Label: {field.label}
+			Placeholder: {field.placeholder}
+			"""
+			
+			suggestions = await _generate_json(
+				ollama_client, self._suggestion_model([field]), prompt, system=self.user_context_prompt()
+			)
 			return suggestions if isinstance(suggestions, list) else [suggestions]
 			
 		except Exception as e:
 			logging.error(f"Suggestion generation error: {e}")
 			return self._fallback_suggestions(field)
 	
+	async def get_batch_suggestions(self, fields: List[FormField], ollama_client) -> Dict[str, List[str]]:
+		"""Get AI-powered suggestions for several fields with one LLM call, keyed by element id"""
+		batch = {}
+		open_fields = []
+		for field in fields:
+			known = self._deterministic_suggestions(field)
+			if known:
+				batch[field.element_id] = known
+			else:
+				open_fields.append(field)
+		
+		fields = open_fields
+		if not fields:
+			return batch
+		
+		field_rows = "\n\t\t\t".join(
+			f"- id: {field.element_id} | type: {field.field_type.value} | "
+			f"label: {field.label} | placeholder: {field.placeholder}"
+			for field in fields
+		)
+		
+		try:
+			# Retrieve similar form patterns for every field in one query, off the event loop
+			similar_patterns = await asyncio.to_thread(
+				self._query_patterns, [f"{field.label} {field.field_type}" for field in fields], 3
+			)
+			
+			prompt = f"""
+			Based on the user context and form fields, suggest appropriate values.
+			Provide 1-3 contextually appropriate suggestions for each field.
+			Return as a JSON object mapping each field id to an array: {{"field_id": ["suggestion1", "suggestion2"]}}
+			
+			Answers from similar forms filled before:
+			{self._past_answers(similar_patterns)}
+			
+			Form Fields:
+			{field_rows}
+			"""
+			
+			suggestions = await _generate_json(
+				ollama_client, self._suggestion_model(fields), prompt, system=self.user_context_prompt()
+			)
+			if not isinstance(suggestions, dict):
+				raise ValueError("expected a JSON object of suggestions")
+			
+		except Exception as e:
+			logging.error(f"Batch suggestion generation error: {e}")
+			suggestions = {}
+		
+		for field in fields:
+			field_suggestions = suggestions.get(field.element_id)
+			if isinstance(field_suggestions, str):
+				field_suggestions = [field_suggestions]
+			batch[field.element_id] = field_suggestions or self._fallback_suggestions(field)
+		return batch
+	
+	def _past_answers(self, similar_patterns: Dict[str, List[List[Any]]]) -> str:
+		"""Label and value pairs from retrieved form patterns, for use as prompt examples"""
+		answers: Dict[str, None] = {}
+		seen = set()
+		for ids, documents in zip(similar_patterns["ids"], similar_patterns["documents"]):
+			for pattern_id, structure in zip(ids, documents):
+				if structure is None or pattern_id in seen:
+					continue
+				seen.add(pattern_id)
+				
+				labels = {f["element_id"]: f["label"] for f in structure.get("fields", [])}
+				for element_id, value in structure.get("values", {}).items():
+					if labels.get(element_id) and value:
+						answers.setdefault(f"- {labels[element_id]}: {value}", None)
+		
+		if not answers:
+			return "none"
+		return "\n\t\t".join(list(answers)[:self.PAST_ANSWER_LIMIT])
+	
+	@staticmethod
+	def _suggestion_model(fields: List[FormField]) -> str:
+		"""Use the larger model only when a field asks for free-form text"""
+		if any(field.field_type == FormFieldType.TEXTAREA for field in fields):
+			return MAIN_MODEL
+		return FAST_MODEL
+	
+	def _deterministic_suggestions(self, field: FormField) -> List[str]:
+		"""Exact answers from the user context for simple field types; empty when the LLM is needed"""
+		if field.field_type not in self.DETERMINISTIC_FIELD_TYPES:
+			return []
+		return self._fallback_suggestions(field)
+	
 	def _fallback_suggestions(self, field: FormField) -> List[str]:
 		"""Fallback suggestions based on field type and user context"""
 		fallbacks = {
@@ -366,11 +791,15 @@ class LocalGPTAgent:
 		self.config = config or {}
 		
 		# Initialize Ollama client
-		self.ollama_client = ollama.Client()
+		# One async client shared by every component, so requests never block the event loop
+		self.ollama_client = ollama.AsyncClient()
 		
 		# Initialize components
 		self.rag_pipeline = RAGPipeline()
-		self.voice_processor = VoiceProcessor(self.ollama_client)
+		self.voice_processor = VoiceProcessor(
+			self.ollama_client,
+			self.config.get("vosk_model_path", VOSK_MODEL_PATH)
+		)
 		self.dom_watcher = DOMWatcher(self.rag_pipeline)
 		
 		# Register callbacks
@@ -379,6 +808,7 @@ class LocalGPTAgent:
 		# State
 		self.active_forms: Dict[str, List[FormField]] = {}
 		self.is_active = False
+		self._stop_event = asyncio.Event()
 	
 	def _setup_callbacks(self):
 		"""Setup inter-component callbacks"""
@@ -406,6 +836,10 @@ class LocalGPTAgent:
 		logging.info("Starting Local GPT Agent...")
 		
 		self.is_active = True
+		self._stop_event.clear()
+		
+		# Load the models now so the first command doesn't pay for it
+		await asyncio.gather(*[self._preload_model(model) for model in (FAST_MODEL, MAIN_MODEL)])
 		
 		# Start components
 		await self.voice_processor.start_listening()
@@ -413,11 +847,34 @@ class LocalGPTAgent:
 		
 		logging.info("Local GPT Agent is active and listening for voice commands")
 	
+	async def _preload_model(self, model: str):
+		"""Pull an LLM if it isn't installed, then load it into memory and keep it resident"""
+		try:
+			await self.ollama_client.show(model)
+		except Exception:
+			# Only contact the registry for a model that isn't available locally
+			try:
+				await self.ollama_client.pull(model)
+			except Exception as e:
+				logging.warning(f"Could not pull {model}: {e}")
+		
+		try:
+			# Same num_ctx as later calls, otherwise Ollama reloads the model on first use
+			await self.ollama_client.generate(
+				model=model,
+				prompt="warmup",
+				keep_alive=OLLAMA_KEEP_ALIVE,
+				options={**OLLAMA_OPTIONS, "num_predict": 1}
+			)
+		except Exception as e:
+			logging.warning(f"Model preload failed for {model}: {e}")
+	
 	async def stop(self):
 		"""Stop the agent"""
 		logging.info("Stopping Local GPT Agent...")
 		
 		self.is_active = False
+		self._stop_event.set()
 		self.voice_processor.stop_listening()
 		self.dom_watcher.stop_watching()
 		
@@ -426,6 +883,10 @@ class LocalGPTAgent:
 		
 		logging.info("Local GPT Agent stopped")
 	
+	async def wait_until_stopped(self):
+		"""Wait until the agent is stopped, e.g. by voice command"""
+		await self._stop_event.wait()
+	
 	async def _handle_fill_form_intent(self, parameters: Dict[str, Any]):
 		"""Handle fill form voice command"""
 		logging.info("Processing fill form request...")
@@ -448,10 +909,11 @@ class LocalGPTAgent:
 		"""Handle save workflow voice command"""
 		logging.info("Saving current workflow...")
 		
-		# Save successful form patterns to RAG pipeline
-		for form_id, fields in self.active_forms.items():
-			filled_values = {f.element_id: f.current_value for f in fields if f.current_value}
-			self.rag_pipeline.add_form_pattern(fields, filled_values)
+		# Save successful form patterns to RAG pipeline in a single batch
+		self.rag_pipeline.add_form_patterns([
+			(fields, {f.element_id: f.current_value for f in fields if f.current_value})
+			for fields in self.active_forms.values()
+		])
 		
 		self.rag_pipeline.save_user_context()
 		logging.info("Workflow saved successfully")
@@ -474,14 +936,19 @@ class LocalGPTAgent:
 		"""Fill form using AI suggestions"""
 		logging.info(f"Intelligently filling form {form_id}")
 		
-		for field in fields:
-			if field.current_value:  # Skip already filled fields
-				continue
-			
-			suggestions = await self.rag_pipeline.get_field_suggestions(
-				field, self.ollama_client
-			)
-			
+		# Skip already filled fields
+		empty_fields = [f for f in fields if not f.current_value]
+		
+		# Keep each prompt short and let Ollama decode the chunks in parallel
+		size = self.rag_pipeline.SUGGESTION_BATCH_SIZE
+		chunks = await asyncio.gather(*[
+			self.rag_pipeline.get_batch_suggestions(empty_fields[i:i + size], self.ollama_client)
+			for i in range(0, len(empty_fields), size)
+		])
+		batch = {element_id: suggestions for chunk in chunks for element_id, suggestions in chunk.items()}
+		
+		for field in empty_fields:
+			suggestions = batch.get(field.element_id)
 			if suggestions and suggestions[0]:
 				# In real implementation, this would fill the actual form field
 				field.current_value = suggestions[0]
@@ -519,9 +986,8 @@ async def main():
 		await agent.start()
 		
 		# Keep running until stopped by voice command
-		while agent.is_active:
-			await asyncio.sleep(1)
-			
+		await agent.wait_until_stopped()
+		
 	except KeyboardInterrupt:
 		logging.info("Received interrupt signal")
 	finally:
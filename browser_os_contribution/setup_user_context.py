@@ -9,7 +9,6 @@ It creates a secure, local profile that the AI agent uses to fill forms intellig
 Privacy Note: All data is stored locally and never sent to external servers.
 """
 
-import json
 import getpass
 from pathlib import Path
 from typing import Dict, List, Any
@@ -337,14 +336,8 @@ class UserContextSetup:
 		rag_pipeline.user_context = self.context
 		rag_pipeline.save_user_context()
 		
-		# Also save as JSON for easy viewing/editing
-		context_file = self.setup_path / "user_profile.json"
-		with open(context_file, 'w') as f:
-			# Convert context to dict for JSON serialization
-			context_dict = self.context.__dict__.copy()
-			json.dump(context_dict, f, indent=2, default=str)
-		
-		print(f"✅ Profile saved to {context_file}")
+		# The saved profile is indented JSON, so it doubles as the file for viewing/editing
+		print(f"✅ Profile saved to {rag_pipeline.user_context_path}")
 		
 		# Show summary
 		self._show_summary()